@@ -267,15 +267,12 @@ def _parse_payload_json(payload: str) -> dict[str, object]:
 
 
 def _parse_payload_pairs(pairs: list[str]) -> dict[str, object]:
-    payload: dict[str, object] = {}
-    for pair in pairs:
-        if "=" not in pair:
-            raise ValueError(f"Invalid --set value '{pair}'. Expected key=value.")
-        key, value = pair.split("=", 1)
-        key = key.strip()
-        if not key:
-            raise ValueError("Payload key in --set cannot be empty.")
-        payload[key] = value
+    invalid = next((pair for pair in pairs if "=" not in pair), None)
+    if invalid is not None:
+        raise ValueError(f"Invalid --set value '{invalid}'. Expected key=value.")
+    payload: dict[str, object] = {key.strip(): value for key, _, value in (pair.partition("=") for pair in pairs)}
+    if "" in payload:
+        raise ValueError("Payload key in --set cannot be empty.")
     return payload
 
 
@@ -6,6 +6,8 @@ import re
 from datetime import datetime, timedelta, timezone
 from email.message import Message
 
+DEFAULT_OTP_PATTERN = re.compile(r"\b(\d{6})\b")
+
 
 class EmailOTPConnector:
     """Read mailbox messages and extract OTP codes."""
@@ -20,9 +22,10 @@ class EmailOTPConnector:
         self,
         *,
         sender_contains: str,
-        otp_pattern: str = r"\b(\d{6})\b",
+        otp_pattern: str | re.Pattern[str] = DEFAULT_OTP_PATTERN,
         lookback_minutes: int = 15,
     ) -> str | None:
+        pattern = re.compile(otp_pattern) if isinstance(otp_pattern, str) else otp_pattern
         cutoff = datetime.now(timezone.utc) - timedelta(minutes=lookback_minutes)
 
         with imaplib.IMAP4_SSL(self.host) as client:
@@ -62,7 +65,7 @@ class EmailOTPConnector:
                         continue
 
                 body = self._extract_text_body(message)
-                match = re.search(otp_pattern, body)
+                match = pattern.search(body)
                 if match:
                     return match.group(1)
         return None
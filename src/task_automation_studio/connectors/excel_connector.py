@@ -1,32 +1,81 @@
 from __future__ import annotations
 
+from collections.abc import Iterator, Sequence
 from pathlib import Path
 from typing import Any
 
 import pandas as pd
+from openpyxl import Workbook, load_workbook
 
 from task_automation_studio.core.models import RecordInput, RecordResult
 
 
+_STREAMABLE_SUFFIXES = frozenset({".xlsx", ".xlsm"})
+
+
+def _cell_to_str(value: Any) -> str:
+    if value is None:
+        return ""
+    if isinstance(value, float) and value.is_integer():
+        return str(int(value))
+    return str(value)
+
+
 class ExcelConnector:
     REQUIRED_COLUMNS = ("first_name", "last_name", "email")
 
     def read_records(self, file_path: str | Path, sheet_name: str | int = 0) -> list[RecordInput]:
+        return list(self.iter_records(file_path, sheet_name=sheet_name))
+
+    def count_records(self, file_path: str | Path, sheet_name: str | int = 0) -> int:
+        # Validates every row without keeping the models, so callers can reject a bad sheet up front.
+        return sum(1 for _ in self.iter_records(file_path, sheet_name=sheet_name))
+
+    def iter_records(self, file_path: str | Path, sheet_name: str | int = 0) -> Iterator[RecordInput]:
+        # Header validation runs eagerly so a bad file fails before the caller starts consuming rows.
+        if Path(file_path).suffix.lower() not in _STREAMABLE_SUFFIXES:
+            return self._iter_records_with_pandas(file_path, sheet_name=sheet_name)
+
+        workbook = load_workbook(file_path, read_only=True, data_only=True)
+        try:
+            sheet = workbook[sheet_name] if isinstance(sheet_name, str) else workbook.worksheets[sheet_name]
+            rows = sheet.iter_rows(values_only=True)
+            header = next(rows, ())
+            columns = self._required_column_positions([_cell_to_str(cell) for cell in header])
+        except Exception:
+            workbook.close()
+            raise
+        return self._iter_sheet_records(workbook, rows, columns)
+
+    def _iter_sheet_records(
+        self,
+        workbook: Workbook,
+        rows: Iterator[tuple[Any, ...]],
+        columns: Sequence[int],
+    ) -> Iterator[RecordInput]:
+        try:
+            for row in rows:
+                values = [_cell_to_str(row[pos]) if pos < len(row) else "" for pos in columns]
+                if any(values):
+                    yield self._build_record(values)
+        finally:
+            workbook.close()
+
+    def _iter_records_with_pandas(self, file_path: str | Path, sheet_name: str | int) -> Iterator[RecordInput]:
         df = pd.read_excel(file_path, sheet_name=sheet_name, dtype=str).fillna("")
-        missing_columns = [col for col in self.REQUIRED_COLUMNS if col not in df.columns]
+        self._required_column_positions(list(df.columns))
+        rows = df[list(self.REQUIRED_COLUMNS)].itertuples(index=False, name=None)
+        return (self._build_record(row) for row in rows if any(row))
+
+    def _required_column_positions(self, header: Sequence[str]) -> list[int]:
+        missing_columns = [col for col in self.REQUIRED_COLUMNS if col not in header]
         if missing_columns:
             raise ValueError(f"Missing required columns in Excel file: {', '.join(missing_columns)}")
+        return [header.index(col) for col in self.REQUIRED_COLUMNS]
 
-        records: list[RecordInput] = []
-        for row in df[list(self.REQUIRED_COLUMNS)].to_dict(orient="records"):
-            records.append(
-                RecordInput(
-                    first_name=row["first_name"].strip(),
-                    last_name=row["last_name"].strip(),
-                    email=row["email"].strip(),
-                )
-            )
-        return records
+    def _build_record(self, values: Sequence[str]) -> RecordInput:
+        first_name, last_name, email = values
+        return RecordInput(first_name=first_name, last_name=last_name, email=email)
 
     def write_results(
         self,
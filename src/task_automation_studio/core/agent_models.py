@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+import sys
 from enum import StrEnum
 from typing import Any
 
@@ -50,6 +51,11 @@ class SkillDescriptor(BaseModel):
     default_success_signals: list[str] = Field(default_factory=list)
     reliability_score: float = Field(default=0.8, ge=0.0, le=1.0)
 
+    @field_validator("skill_id")
+    @classmethod
+    def intern_skill_id(cls, value: str) -> str:
+        return sys.intern(value)
+
 
 class AgentPlanStep(BaseModel):
     step_id: str = Field(min_length=1)
@@ -61,6 +67,16 @@ class AgentPlanStep(BaseModel):
     fallback_skill_ids: list[str] = Field(default_factory=list)
     max_attempts: int = Field(default=2, ge=1, le=10)
 
+    @field_validator("skill_id")
+    @classmethod
+    def intern_skill_id(cls, value: str) -> str:
+        return sys.intern(value)
+
+    @field_validator("fallback_skill_ids")
+    @classmethod
+    def intern_fallback_skill_ids(cls, value: list[str]) -> list[str]:
+        return [sys.intern(item) for item in value]
+
 
 class AgentPlan(BaseModel):
     plan_id: str = Field(min_length=1)
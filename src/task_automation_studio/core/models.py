@@ -1,9 +1,10 @@
 from __future__ import annotations
 
 import re
+import sys
 from typing import Any
 
-from pydantic import BaseModel, Field, field_validator
+from pydantic import BaseModel, ConfigDict, Field, field_validator
 
 from task_automation_studio.core.enums import ExecutionStatus, RecordStatus
 
@@ -12,12 +13,16 @@ EMAIL_REGEX = re.compile(r"^[^@\s]+@[^@\s]+\.[^@\s]+$")
 
 
 class StepPolicy(BaseModel):
+    model_config = ConfigDict(frozen=True)
+
     timeout_seconds: int = Field(default=30, ge=1, le=600)
     retry_count: int = Field(default=2, ge=0, le=10)
     retry_backoff_seconds: int = Field(default=2, ge=1, le=60)
 
 
 class StepDefinition(BaseModel):
+    model_config = ConfigDict(frozen=True)
+
     step_id: str = Field(min_length=1)
     name: str = Field(min_length=1)
     action: str = Field(min_length=1)
@@ -26,14 +31,23 @@ class StepDefinition(BaseModel):
     success_signals: list[str] = Field(default_factory=list)
     policy: StepPolicy = Field(default_factory=StepPolicy)
 
+    @field_validator("action")
+    @classmethod
+    def intern_action(cls, value: str) -> str:
+        return sys.intern(value)
+
 
 class WorkflowDefinition(BaseModel):
+    model_config = ConfigDict(frozen=True)
+
     workflow_id: str = Field(min_length=1)
     name: str = Field(min_length=1)
     steps: list[StepDefinition] = Field(min_length=1)
 
 
 class RecordInput(BaseModel):
+    model_config = ConfigDict(frozen=True, str_strip_whitespace=True)
+
     first_name: str = Field(min_length=1)
     last_name: str = Field(min_length=1)
     email: str = Field(min_length=5)
@@ -43,7 +57,7 @@ class RecordInput(BaseModel):
     def validate_email(cls, value: str) -> str:
         if not EMAIL_REGEX.match(value):
             raise ValueError("Invalid email format.")
-        return value.lower().strip()
+        return value.lower()
 
 
 class RecordContext(BaseModel):
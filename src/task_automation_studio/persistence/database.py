@@ -1,18 +1,33 @@
 from __future__ import annotations
 
 from pathlib import Path
+from typing import Any
 
-from sqlalchemy import create_engine
+from sqlalchemy import create_engine, event
 from sqlalchemy.orm import Session, sessionmaker
 
 from task_automation_studio.persistence.models import Base
 
 
 def create_sqlite_engine(database_url: str):
-    if database_url.startswith("sqlite:///"):
+    is_file_database = database_url.startswith("sqlite:///") and database_url != "sqlite:///:memory:"
+    if is_file_database:
         db_path = database_url.replace("sqlite:///", "", 1)
         Path(db_path).parent.mkdir(parents=True, exist_ok=True)
-    return create_engine(database_url, echo=False, future=True)
+    engine = create_engine(database_url, echo=False, future=True)
+    if is_file_database:
+        event.listen(engine, "connect", _configure_sqlite_connection)
+    return engine
+
+
+def _configure_sqlite_connection(dbapi_connection: Any, connection_record: Any) -> None:
+    del connection_record
+    cursor = dbapi_connection.cursor()
+    try:
+        cursor.execute("PRAGMA journal_mode=WAL")
+        cursor.execute("PRAGMA synchronous=NORMAL")
+    finally:
+        cursor.close()
 
 
 def init_database(database_url: str) -> sessionmaker[Session]:
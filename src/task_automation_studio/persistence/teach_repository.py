@@ -1,6 +1,7 @@
 from __future__ import annotations
 
 import json
+from collections.abc import Sequence
 from datetime import datetime
 
 from sqlalchemy import select
@@ -30,13 +31,28 @@ class TeachSessionRepository:
         return self._session.scalars(stmt).first()
 
     def add_event(self, *, session_id: str, event: TeachEventData) -> TeachEvent:
+        session = self.get_recording_session(session_id)
+        model = self._to_event_model(session, event)
+        self._session.add(model)
+        self._session.commit()
+        self._session.refresh(model)
+        return model
+
+    def add_events(self, *, session_id: str, events: Sequence[TeachEventData]) -> None:
+        session = self.get_recording_session(session_id)
+        self._session.add_all([self._to_event_model(session, event) for event in events])
+        self._session.commit()
+
+    def get_recording_session(self, session_id: str) -> TeachSession:
         session = self.get_by_session_id(session_id)
         if session is None:
             raise ValueError(f"Teach session '{session_id}' not found.")
         if session.status != TeachSessionStatus.RECORDING.value:
             raise ValueError(f"Teach session '{session_id}' is not in recording state.")
+        return session
 
-        model = TeachEvent(
+    def _to_event_model(self, session: TeachSession, event: TeachEventData) -> TeachEvent:
+        return TeachEvent(
             teach_session_id=session.id,
             event_id=event.event_id,
             event_type=event.event_type.value,
@@ -44,10 +60,6 @@ class TeachSessionRepository:
             sensitive=event.sensitive,
             created_at=event.timestamp,
         )
-        self._session.add(model)
-        self._session.commit()
-        self._session.refresh(model)
-        return model
 
     def finish_session(self, session_id: str) -> TeachSession:
         session = self.get_by_session_id(session_id)
@@ -25,9 +25,11 @@ class AgentSkillRegistry:
     def __init__(self) -> None:
         self._skills: dict[str, SkillDescriptor] = {}
         self._handlers: dict[str, AgentSkillHandler] = {}
+        self._intent_index: dict[str, tuple[SkillDescriptor, ...]] | None = None
 
     def register(self, descriptor: SkillDescriptor) -> None:
         self._skills[descriptor.skill_id] = descriptor
+        self._intent_index = None
 
     def register_handler(self, *, skill_id: str, handler: AgentSkillHandler) -> None:
         if skill_id not in self._skills:
@@ -44,9 +46,14 @@ class AgentSkillRegistry:
         return list(self._skills.values())
 
     def skills_for_intent(self, intent: str) -> list[SkillDescriptor]:
-        intent_norm = intent.strip().lower()
-        matches: list[SkillDescriptor] = []
+        index = self._intent_index
+        if index is None:
+            index = self._intent_index = self._build_intent_index()
+        return list(index.get(intent.strip().lower(), ()))
+
+    def _build_intent_index(self) -> dict[str, tuple[SkillDescriptor, ...]]:
+        grouped: dict[str, list[SkillDescriptor]] = {}
         for descriptor in self._skills.values():
-            if any(item.lower() == intent_norm for item in descriptor.supported_intents):
-                matches.append(descriptor)
-        return matches
+            for item in dict.fromkeys(item.lower() for item in descriptor.supported_intents):
+                grouped.setdefault(item, []).append(descriptor)
+        return {intent: tuple(descriptors) for intent, descriptors in grouped.items()}
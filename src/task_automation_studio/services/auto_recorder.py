@@ -3,6 +3,8 @@ from __future__ import annotations
 import logging
 import threading
 import time
+from enum import Enum
+from functools import lru_cache
 from typing import Any
 from uuid import uuid4
 
@@ -18,22 +20,39 @@ DOUBLE_CLICK_RADIUS_PX = 8
 
 
 def _button_to_name(button: Any) -> str:
-    name = str(button)
+    return _button_name_from_str(str(button))
+
+
+@lru_cache(maxsize=64)
+def _button_name_from_str(name: str) -> str:
     if "." in name:
         return name.split(".", 1)[1].lower()
     return name.lower()
 
 
 def _key_to_name(key: Any) -> str:
+    if isinstance(key, Enum):
+        return _special_key_name(key)
     char = getattr(key, "char", None)
     if char:
         return str(char).lower()
-    name = str(key)
+    return _key_name_from_str(str(key))
+
+
+@lru_cache(maxsize=256)
+def _special_key_name(key: Enum) -> str:
+    # pynput's Key members are singletons, so their names can be cached by identity.
+    return _key_name_from_str(str(key))
+
+
+@lru_cache(maxsize=256)
+def _key_name_from_str(name: str) -> str:
     if name.lower().startswith("key."):
         return name.split(".", 1)[1].lower()
     return name.lower()
 
 
+@lru_cache(maxsize=256)
 def _canonical_modifier_name(key_name: str) -> str | None:
     lowered = key_name.lower()
     if lowered.startswith("ctrl"):
@@ -116,6 +135,8 @@ class AutoTeachRecorder:
 
         if finish_session and session_id:
             self._service.finish_session(session_id=session_id)
+        elif session_id:
+            self._service.flush_events(session_id=session_id)
         self._stopped_event.set()
 
     def wait_until_stopped(self, timeout: float | None = None) -> bool:
@@ -182,7 +203,7 @@ class AutoTeachRecorder:
             session_id = self._session_id
             if not session_id:
                 return
-            self._service.add_event(
+            self._service.queue_event(
                 session_id=session_id,
                 event_type=TeachEventType.MOUSE_SCROLL,
                 payload={"x": x, "y": y, "dx": dx, "dy": dy, "t_ms": self._elapsed_ms()},
@@ -216,7 +237,7 @@ class AutoTeachRecorder:
             if self._pressed_modifiers:
                 ordered_modifiers = [m for m in ("ctrl", "alt", "shift", "cmd") if m in self._pressed_modifiers]
                 combo = "+".join([*ordered_modifiers, key_name])
-                self._service.add_event(
+                self._service.queue_event(
                     session_id=session_id,
                     event_type=TeachEventType.HOTKEY,
                     payload={
@@ -229,7 +250,7 @@ class AutoTeachRecorder:
                 )
                 return None
 
-            self._service.add_event(
+            self._service.queue_event(
                 session_id=session_id,
                 event_type=TeachEventType.KEY_PRESS,
                 payload={"key": key_name, "t_ms": self._elapsed_ms()},
@@ -284,7 +305,7 @@ class AutoTeachRecorder:
                 enriched["window_context"] = window_context
         except Exception:
             LOGGER.exception("Auto recorder window context capture failed; continuing without context.")
-        self._service.add_event(
+        self._service.queue_event(
             session_id=session_id,
             event_type=TeachEventType.MOUSE_CLICK,
             payload=enriched,
@@ -1,10 +1,11 @@
 from __future__ import annotations
 
 import logging
+import re
 from dataclasses import dataclass
 
 from task_automation_studio.connectors.browser_connector import PlaywrightBrowserConnector
-from task_automation_studio.connectors.email_connector import EmailOTPConnector
+from task_automation_studio.connectors.email_connector import DEFAULT_OTP_PATTERN, EmailOTPConnector
 from task_automation_studio.core.enums import ExecutionStatus
 from task_automation_studio.core.interfaces import StepExecutor
 from task_automation_studio.core.models import RecordContext, StepDefinition, StepExecutionResult
@@ -110,6 +111,10 @@ class EmailOtpStepExecutor:
                 evidence={"configured": True},
             )
 
+        otp_pattern = step.params.get("otp_pattern")
+        # Templates spell out the default as a string; reuse the precompiled pattern for it.
+        if otp_pattern is None or otp_pattern == DEFAULT_OTP_PATTERN.pattern:
+            otp_pattern = DEFAULT_OTP_PATTERN
         try:
             connector = EmailOTPConnector(
                 host=self._config.host,
@@ -119,7 +124,7 @@ class EmailOtpStepExecutor:
             )
             otp = connector.fetch_latest_otp(
                 sender_contains=sender_filter,
-                otp_pattern=str(step.params.get("otp_pattern", r"\b(\d{6})\b")),
+                otp_pattern=otp_pattern if isinstance(otp_pattern, re.Pattern) else str(otp_pattern),
                 lookback_minutes=int(step.params.get("lookback_minutes", 15)),
             )
         except Exception as exc:
@@ -21,7 +21,9 @@ class JobOrchestrator:
         dry_run: bool = False,
         safe_stop_error_rate: float = 0.2,
     ) -> list[RecordResult]:
-        records = self._excel.read_records(input_file)
+        # Reject a bad sheet before any record runs; the batch then streams the rows.
+        self._excel.count_records(input_file)
+        records = self._excel.iter_records(input_file)
         results = self._engine.run_batch(
             workflow=workflow,
             records=records,
@@ -1,6 +1,8 @@
 from __future__ import annotations
 
 import json
+import threading
+from collections.abc import Callable
 from dataclasses import asdict, dataclass
 from datetime import datetime
 from pathlib import Path
@@ -31,6 +33,7 @@ class RunSummary:
     safe_stopped: bool
     output_file: str
     report_file: str
+    cancelled: bool = False
 
     def to_dict(self) -> dict[str, object]:
         return asdict(self)
@@ -52,8 +55,11 @@ class AutomationRunner:
         dry_run: bool,
         safe_stop_error_rate: float,
         email_config: EmailRuntimeConfig,
+        progress_callback: Callable[[int, str], None] | None = None,
+        stop_event: threading.Event | None = None,
     ) -> RunSummary:
-        records = self._excel.read_records(input_file)
+        # Validate the whole sheet before any side effects; records are streamed again for the run itself.
+        total_records = self._excel.count_records(input_file)
         browser_connector = PlaywrightBrowserConnector(headless=True)
         self._register_default_browser_handlers(browser_connector=browser_connector)
 
@@ -78,50 +84,71 @@ class AutomationRunner:
         processed_non_skipped = 0
         failed_or_review = 0
         safe_stopped = False
+        cancelled = False
         job_run_id = 0
 
-        with self._session_factory() as session:
-            repo = JobRepository(session)
-            job = repo.create_job_run(workflow.workflow_id)
-            job_run_id = job.id
-
-            for record in records:
-                if record.email in seen_emails:
-                    duplicate_count += 1
-                    result = self._build_duplicate_result(record)
-                else:
-                    seen_emails.add(record.email)
-                    result = engine.run_record(workflow=workflow, record=record, dry_run=dry_run)
-
-                    processed_non_skipped += 1
-                    if result.status in {RecordStatus.FAILED, RecordStatus.NEEDS_REVIEW}:
-                        failed_or_review += 1
-
-                    if processed_non_skipped > 0:
-                        error_rate = failed_or_review / processed_non_skipped
-                        if error_rate > safe_stop_error_rate:
-                            safe_stopped = True
-
-                repo.add_record_result(job.id, result)
-                results.append(result)
-
-                if safe_stopped:
-                    break
-
-            repo.complete_job_run(job.id, status="safe_stopped" if safe_stopped else "completed")
-
-        self._excel.write_results(output_path, results)
-        summary = self._build_summary(
-            workflow_id=workflow.workflow_id,
-            job_run_id=job_run_id,
-            total_records=len(records),
-            duplicate_skipped=duplicate_count,
-            safe_stopped=safe_stopped,
-            results=results,
-            output_file=output_path,
-            report_file=report_path,
-        )
-        self._write_report(report_path, summary)
+        try:
+            with self._session_factory() as session:
+                repo = JobRepository(session)
+                job = repo.create_job_run(workflow.workflow_id)
+                job_run_id = job.id
+                job_status = "failed"
+                try:
+                    for record in self._excel.iter_records(input_file):
+                        if stop_event is not None and stop_event.is_set():
+                            cancelled = True
+                            break
+
+                        if record.email in seen_emails:
+                            duplicate_count += 1
+                            result = self._build_duplicate_result(record)
+                        else:
+                            seen_emails.add(record.email)
+                            result = engine.run_record(workflow=workflow, record=record, dry_run=dry_run)
+
+                            processed_non_skipped += 1
+                            if result.status in {RecordStatus.FAILED, RecordStatus.NEEDS_REVIEW}:
+                                failed_or_review += 1
+
+                            if processed_non_skipped > 0:
+                                error_rate = failed_or_review / processed_non_skipped
+                                if error_rate > safe_stop_error_rate:
+                                    safe_stopped = True
+
+                        repo.add_record_result(job.id, result)
+                        results.append(result)
+                        if progress_callback is not None:
+                            progress_callback(len(results), f"{record.email}: {result.status.value}")
+
+                        if safe_stopped:
+                            break
+
+                    if cancelled:
+                        job_status = "cancelled"
+                    elif safe_stopped:
+                        job_status = "safe_stopped"
+                    else:
+                        job_status = "completed"
+                except BaseException:
+                    session.rollback()
+                    raise
+                finally:
+                    repo.complete_job_run(job.id, status=job_status)
+        finally:
+            # Partial results are still written when the run fails part-way.
+            self._excel.write_results(output_path, results)
+            summary = self._build_summary(
+                workflow_id=workflow.workflow_id,
+                job_run_id=job_run_id,
+                total_records=total_records,
+                duplicate_skipped=duplicate_count,
+                safe_stopped=safe_stopped,
+                cancelled=cancelled,
+                results=results,
+                output_file=output_path,
+                report_file=report_path,
+            )
+            self._write_report(report_path, summary)
         return summary
 
     def _register_default_browser_handlers(self, *, browser_connector: PlaywrightBrowserConnector) -> None:
@@ -156,6 +183,7 @@ class AutomationRunner:
         total_records: int,
         duplicate_skipped: int,
         safe_stopped: bool,
+        cancelled: bool,
         results: list[RecordResult],
         output_file: Path,
         report_file: Path,
@@ -179,6 +207,7 @@ class AutomationRunner:
             safe_stopped=safe_stopped,
             output_file=str(output_file),
             report_file=str(report_file),
+            cancelled=cancelled,
         )
 
     def _write_report(self, report_path: Path, summary: RunSummary) -> None:
@@ -1,8 +1,10 @@
 from __future__ import annotations
 
-import json
+import hashlib
 from pathlib import Path
 
+import orjson
+
 from task_automation_studio.core.teach_models import TeachEventData, TeachEventType, TeachSessionData
 from task_automation_studio.services.teach_sessions import TeachSessionService
 
@@ -14,11 +16,16 @@ EVENT_TO_STEP_TYPE: dict[TeachEventType, str] = {
     TeachEventType.WAIT_FOR: "wait_for",
     TeachEventType.CHECKPOINT: "wait_for",
 }
+SKIPPED_EVENT_TYPES = frozenset(
+    {TeachEventType.CLIPBOARD_COPY, TeachEventType.CLIPBOARD_PASTE, TeachEventType.WINDOW_SWITCH}
+)
+_COMPILED_CACHE_SIZE = 32
 
 
 class TeachSessionCompiler:
     def __init__(self, session_service: TeachSessionService) -> None:
         self._session_service = session_service
+        self._compiled_cache: dict[bytes, bytes] = {}
 
     def compile_to_workflow(
         self,
@@ -28,13 +35,31 @@ class TeachSessionCompiler:
         output_file: str | Path,
     ) -> Path:
         session = self._session_service.get_session(session_id=session_id)
-        workflow = self._build_workflow_payload(session=session, workflow_id=workflow_id)
+        cache_key = self._cache_key(session=session, workflow_id=workflow_id)
+        compiled = self._compiled_cache.get(cache_key)
+        if compiled is None:
+            workflow = self._build_workflow_payload(session=session, workflow_id=workflow_id)
+            compiled = orjson.dumps(workflow, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS)
+            if len(self._compiled_cache) >= _COMPILED_CACHE_SIZE:
+                self._compiled_cache.pop(next(iter(self._compiled_cache)))
+            self._compiled_cache[cache_key] = compiled
 
         output_path = Path(output_file)
         output_path.parent.mkdir(parents=True, exist_ok=True)
-        output_path.write_text(json.dumps(workflow, indent=2), encoding="utf-8")
+        output_path.write_bytes(compiled)
         return output_path
 
+    def _cache_key(self, *, session: TeachSessionData, workflow_id: str) -> bytes:
+        # Recorded events are append-only, so their ids identify the session content.
+        digest = hashlib.blake2b(digest_size=16)
+        for part in (session.session_id, workflow_id, session.name):
+            digest.update(part.encode())
+            digest.update(b"\0")
+        for event in session.events:
+            digest.update(event.event_id.encode())
+            digest.update(b"|")
+        return digest.digest()
+
     def _build_workflow_payload(self, *, session: TeachSessionData, workflow_id: str) -> dict[str, object]:
         steps: list[dict[str, object]] = []
         for idx, event in enumerate(session.events, start=1):
@@ -59,7 +84,7 @@ class TeachSessionCompiler:
         }
 
     def _event_to_step(self, *, event: TeachEventData, index: int) -> dict[str, object] | None:
-        if event.event_type in {TeachEventType.CLIPBOARD_COPY, TeachEventType.CLIPBOARD_PASTE, TeachEventType.WINDOW_SWITCH}:
+        if event.event_type in SKIPPED_EVENT_TYPES:
             return None
 
         step_type = EVENT_TO_STEP_TYPE.get(event.event_type)
@@ -67,7 +92,7 @@ class TeachSessionCompiler:
             return None
 
         post_check = {}
-        if event.event_type == TeachEventType.CHECKPOINT:
+        if event.event_type is TeachEventType.CHECKPOINT:
             post_check = {"checkpoint": str(event.payload.get("name", "checkpoint"))}
 
         required_inputs = self._infer_required_inputs(event)
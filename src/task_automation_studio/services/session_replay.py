@@ -1,14 +1,16 @@
 from __future__ import annotations
 
-import json
 import logging
 import threading
-import time
+from collections.abc import Callable
 from dataclasses import dataclass
 from datetime import datetime
+from functools import lru_cache
 from pathlib import Path
 from typing import Any
 
+import orjson
+
 from task_automation_studio.core.agent_models import AgentGoal, AgentGoalType, AgentState, SkillDescriptor
 from task_automation_studio.core.teach_models import TeachEventData, TeachEventType
 from task_automation_studio.services.agent_planner import GoalPlanner
@@ -18,12 +20,17 @@ from task_automation_studio.services.smart_locator import resolve_smart_click_po
 from task_automation_studio.services.teach_sessions import TeachSessionService
 
 LOGGER = logging.getLogger("task_automation_studio")
+MODIFIER_KEY_ATTRS: dict[str, tuple[str, str]] = {
+    "ctrl": ("ctrl", "ctrl_l"),
+    "alt": ("alt", "alt_l"),
+    "shift": ("shift", "shift_l"),
+    "cmd": ("cmd", "cmd_l"),
+}
+ESCAPE_KEY_NAMES = frozenset({"key.esc", "esc"})
 
 
 def _normalize_speed_factor(value: float) -> float:
-    if value <= 0:
-        return 1.0
-    return min(value, 10.0)
+    return min(value, 10.0) if value > 0 else 1.0
 
 
 def _normalize_repeat_count(value: int) -> int:
@@ -33,22 +40,13 @@ def _normalize_repeat_count(value: int) -> int:
 
 
 def _is_escape_key(key: Any) -> bool:
-    char = getattr(key, "char", None)
-    if isinstance(char, str) and char.lower() == "\x1b":
+    if getattr(key, "char", None) == "\x1b":
         return True
-    key_name = str(key).lower()
-    return key_name in {"key.esc", "esc"}
+    return str(key).lower() in ESCAPE_KEY_NAMES
 
 
 def _sleep_with_stop(total_seconds: float, stop_event: threading.Event) -> bool:
-    remaining = max(0.0, total_seconds)
-    while remaining > 0:
-        if stop_event.is_set():
-            return False
-        chunk = min(0.05, remaining)
-        time.sleep(chunk)
-        remaining -= chunk
-    return not stop_event.is_set()
+    return not stop_event.wait(timeout=max(0.0, total_seconds))
 
 
 def _event_time_ms(event: TeachEventData) -> int:
@@ -58,42 +56,42 @@ def _event_time_ms(event: TeachEventData) -> int:
     return int(event.timestamp.timestamp() * 1000)
 
 
+@lru_cache(maxsize=8)
+def _button_table(mouse_module: Any) -> dict[str, Any]:
+    button = mouse_module.Button
+    return {name: getattr(button, name) for name in ("left", "right", "middle") if hasattr(button, name)}
+
+
+@lru_cache(maxsize=256)
+def _special_key(name: str, keyboard_module: Any) -> Any:
+    return getattr(keyboard_module.Key, name, None)
+
+
+@lru_cache(maxsize=8)
+def _modifier_table(keyboard_module: Any) -> dict[str, Any]:
+    key_class = keyboard_module.Key
+    table: dict[str, Any] = {}
+    for name, (primary, fallback) in MODIFIER_KEY_ATTRS.items():
+        key = getattr(key_class, primary, None)
+        table[name] = key if key is not None else getattr(key_class, fallback, None)
+    return table
+
+
 def _button_name_to_key(name: str, mouse_module: Any) -> Any:
-    normalized = name.lower()
-    if normalized == "left":
-        return mouse_module.Button.left
-    if normalized == "right":
-        return mouse_module.Button.right
-    if normalized == "middle":
-        return mouse_module.Button.middle
-    return mouse_module.Button.left
+    buttons = _button_table(mouse_module)
+    return buttons.get(name.lower(), buttons["left"])
 
 
 def _key_name_to_key(name: str, keyboard_module: Any) -> Any:
     normalized = name.lower()
-    special = getattr(keyboard_module.Key, normalized, None)
+    special = _special_key(normalized, keyboard_module)
     if special is not None:
         return special
     return normalized
 
 
 def _modifier_name_to_key(name: str, keyboard_module: Any) -> Any:
-    normalized = name.lower()
-    if normalized == "ctrl":
-        key = getattr(keyboard_module.Key, "ctrl", None) or getattr(keyboard_module.Key, "ctrl_l", None)
-        return key
-    if normalized == "alt":
-        key = getattr(keyboard_module.Key, "alt", None) or getattr(keyboard_module.Key, "alt_l", None)
-        return key
-    if normalized == "shift":
-        key = getattr(keyboard_module.Key, "shift", None) or getattr(keyboard_module.Key, "shift_l", None)
-        return key
-    if normalized == "cmd":
-        key = getattr(keyboard_module.Key, "cmd", None)
-        if key is None:
-            key = getattr(keyboard_module.Key, "cmd_l", None)
-        return key
-    return None
+    return _modifier_table(keyboard_module).get(name.lower())
 
 
 def _resolve_click_target(payload: dict[str, Any]) -> tuple[int, int] | None:
@@ -140,11 +138,25 @@ class EventApplyResult:
     details: dict[str, object]
 
 
+@dataclass(frozen=True, slots=True)
+class _ReplayDevices:
+    mouse_module: Any
+    keyboard_module: Any
+    mouse_controller: Any
+    keyboard_controller: Any
+
+
 class TeachSessionReplayer:
     """Replay teach session events using global mouse/keyboard controllers."""
 
     def __init__(self, session_service: TeachSessionService) -> None:
         self._service = session_service
+        self._event_handlers: dict[TeachEventType, Callable[[TeachEventData, _ReplayDevices], EventApplyResult]] = {
+            TeachEventType.MOUSE_CLICK: self._run_mouse_click_agent,
+            TeachEventType.MOUSE_SCROLL: self._apply_mouse_scroll,
+            TeachEventType.KEY_PRESS: self._run_key_press_agent,
+            TeachEventType.HOTKEY: self._run_hotkey_agent,
+        }
 
     def replay(
         self,
@@ -180,8 +192,12 @@ class TeachSessionReplayer:
 
         safe_speed = _normalize_speed_factor(speed_factor)
         safe_repeat_count = _normalize_repeat_count(repeat_count)
-        mouse_controller = mouse.Controller()
-        keyboard_controller = keyboard.Controller()
+        devices = _ReplayDevices(
+            mouse_module=mouse,
+            keyboard_module=keyboard,
+            mouse_controller=mouse.Controller(),
+            keyboard_controller=keyboard.Controller(),
+        )
         stop_event = threading.Event()
 
         def _on_stop_key(key: Any) -> bool | None:
@@ -198,28 +214,24 @@ class TeachSessionReplayer:
         diagnostics: list[dict[str, object]] = []
         completed_loops = 0
 
+        event_times = [_event_time_ms(event) for event in events]
+        delays = [0.0]
+        delays.extend(
+            max(0, current - previous) / 1000 / safe_speed for previous, current in zip(event_times, event_times[1:])
+        )
+
         for loop_index in range(safe_repeat_count):
             if stop_event.is_set():
                 break
-            previous_time = _event_time_ms(events[0])
 
-            for event in events:
+            for event, delay_seconds in zip(events, delays):
                 if stop_event.is_set():
                     break
-                current_time = _event_time_ms(event)
-                delay_seconds = max(0, current_time - previous_time) / 1000 / safe_speed
                 if delay_seconds > 0:
                     if not _sleep_with_stop(delay_seconds, stop_event):
                         break
-                previous_time = current_time
-
-                result = self._apply_event(
-                    event=event,
-                    mouse_module=mouse,
-                    keyboard_module=keyboard,
-                    mouse_controller=mouse_controller,
-                    keyboard_controller=keyboard_controller,
-                )
+
+                result = self._dispatch_event(event, devices)
                 diagnostics.append(
                     {
                         "loop": loop_index + 1,
@@ -263,7 +275,7 @@ class TeachSessionReplayer:
             output_path = Path(output_file)
 
         output_path.parent.mkdir(parents=True, exist_ok=True)
-        output_path.write_text(json.dumps(summary.to_dict(), indent=2), encoding="utf-8")
+        output_path.write_bytes(orjson.dumps(summary.to_dict(), option=orjson.OPT_INDENT_2))
         return output_path
 
     def _apply_event(
@@ -275,46 +287,38 @@ class TeachSessionReplayer:
         mouse_controller: Any,
         keyboard_controller: Any,
     ) -> EventApplyResult:
-        if event.event_type == TeachEventType.MOUSE_CLICK:
-            return self._run_mouse_click_agent(
-                event=event,
-                mouse_module=mouse_module,
-                mouse_controller=mouse_controller,
-            )
-
-        if event.event_type == TeachEventType.MOUSE_SCROLL:
-            x = event.payload.get("x")
-            y = event.payload.get("y")
-            if isinstance(x, int) and isinstance(y, int):
-                mouse_controller.position = (x, y)
-            dx = int(event.payload.get("dx", 0))
-            dy = int(event.payload.get("dy", 0))
-            mouse_controller.scroll(dx, dy)
-            return EventApplyResult(applied=True, reason="scroll_applied", details={"dx": dx, "dy": dy})
-
-        if event.event_type == TeachEventType.KEY_PRESS:
-            return self._run_key_press_agent(
-                event=event,
-                keyboard_module=keyboard_module,
-                keyboard_controller=keyboard_controller,
-            )
-
-        if event.event_type == TeachEventType.HOTKEY:
-            return self._run_hotkey_agent(
-                event=event,
-                keyboard_module=keyboard_module,
-                keyboard_controller=keyboard_controller,
-            )
-
-        return EventApplyResult(
-            applied=False,
-            reason="unsupported_event_type",
-            details={"event_type": event.event_type.value},
+        devices = _ReplayDevices(
+            mouse_module=mouse_module,
+            keyboard_module=keyboard_module,
+            mouse_controller=mouse_controller,
+            keyboard_controller=keyboard_controller,
         )
+        return self._dispatch_event(event, devices)
 
-    def _run_mouse_click_agent(
-        self, *, event: TeachEventData, mouse_module: Any, mouse_controller: Any
-    ) -> EventApplyResult:
+    def _dispatch_event(self, event: TeachEventData, devices: _ReplayDevices) -> EventApplyResult:
+        handler = self._event_handlers.get(event.event_type)
+        if handler is None:
+            return EventApplyResult(
+                applied=False,
+                reason="unsupported_event_type",
+                details={"event_type": event.event_type.value},
+            )
+        return handler(event, devices)
+
+    def _apply_mouse_scroll(self, event: TeachEventData, devices: _ReplayDevices) -> EventApplyResult:
+        mouse_controller = devices.mouse_controller
+        x = event.payload.get("x")
+        y = event.payload.get("y")
+        if isinstance(x, int) and isinstance(y, int):
+            mouse_controller.position = (x, y)
+        dx = int(event.payload.get("dx", 0))
+        dy = int(event.payload.get("dy", 0))
+        mouse_controller.scroll(dx, dy)
+        return EventApplyResult(applied=True, reason="scroll_applied", details={"dx": dx, "dy": dy})
+
+    def _run_mouse_click_agent(self, event: TeachEventData, devices: _ReplayDevices) -> EventApplyResult:
+        mouse_module = devices.mouse_module
+        mouse_controller = devices.mouse_controller
         button_name = str(event.payload.get("button", "left")).lower()
         registry = AgentSkillRegistry()
         registry.register(
@@ -427,9 +431,9 @@ class TeachSessionReplayer:
 
         return self._execute_agent_goal(event=event, goal=goal, registry=registry)
 
-    def _run_key_press_agent(
-        self, *, event: TeachEventData, keyboard_module: Any, keyboard_controller: Any
-    ) -> EventApplyResult:
+    def _run_key_press_agent(self, event: TeachEventData, devices: _ReplayDevices) -> EventApplyResult:
+        keyboard_module = devices.keyboard_module
+        keyboard_controller = devices.keyboard_controller
         registry = AgentSkillRegistry()
         registry.register(
             SkillDescriptor(
@@ -523,9 +527,9 @@ class TeachSessionReplayer:
         )
         return self._execute_agent_goal(event=event, goal=goal, registry=registry)
 
-    def _run_hotkey_agent(
-        self, *, event: TeachEventData, keyboard_module: Any, keyboard_controller: Any
-    ) -> EventApplyResult:
+    def _run_hotkey_agent(self, event: TeachEventData, devices: _ReplayDevices) -> EventApplyResult:
+        keyboard_module = devices.keyboard_module
+        keyboard_controller = devices.keyboard_controller
         registry = AgentSkillRegistry()
         registry.register(
             SkillDescriptor(
@@ -587,16 +591,14 @@ class TeachSessionReplayer:
             pressed_modifiers: list[Any] = []
             for modifier_name in [str(item).lower() for item in modifiers]:
                 modifier_key = _modifier_name_to_key(modifier_name, keyboard_module)
-                if modifier_key is None:
-                    continue
-                keyboard_controller.press(modifier_key)
-                pressed_modifiers.append(modifier_key)
+                if modifier_key is not None:
+                    pressed_modifiers.append(modifier_key)
 
             target_key = _key_name_to_key(key_name, keyboard_module)
-            keyboard_controller.press(target_key)
-            keyboard_controller.release(target_key)
-            for modifier_key in reversed(pressed_modifiers):
-                keyboard_controller.release(modifier_key)
+            # pressed() releases the modifiers in reverse order even if the target key fails.
+            with keyboard_controller.pressed(*pressed_modifiers):
+                keyboard_controller.press(target_key)
+                keyboard_controller.release(target_key)
 
             return {
                 "success": True,
@@ -1,35 +1,50 @@
 from __future__ import annotations
 
-import json
+import logging
+import threading
 from datetime import datetime, timezone
 from pathlib import Path
 from uuid import uuid4
 
+from sqlalchemy.exc import SQLAlchemyError
+
 from task_automation_studio.config.settings import Settings
 from task_automation_studio.core.teach_models import TeachEventData, TeachEventType, TeachSessionData
 from task_automation_studio.persistence.database import init_database
 from task_automation_studio.persistence.teach_repository import TeachSessionRepository
 
 
+LOGGER = logging.getLogger("task_automation_studio")
+EVENT_FLUSH_THRESHOLD = 256
+
+
 class TeachSessionService:
     def __init__(self, settings: Settings) -> None:
         self._settings = settings
         self._session_factory = init_database(settings.database_url)
+        self._pending_events: dict[str, list[TeachEventData]] = {}
+        self._pending_lock = threading.Lock()
+        self._recording_session_ids: set[str] = set()
 
     def start_session(self, *, name: str) -> TeachSessionData:
         session_id = uuid4().hex
         with self._session_factory() as session:
             repo = TeachSessionRepository(session)
             repo.create_session(session_id=session_id, name=name)
-            return repo.to_data(session_id)
+            data = repo.to_data(session_id)
+        with self._pending_lock:
+            self._recording_session_ids.add(session_id)
+        return data
 
     def list_sessions(self) -> list[TeachSessionData]:
+        self.flush_events()
         with self._session_factory() as session:
             repo = TeachSessionRepository(session)
             sessions = repo.list_sessions()
             return [repo.to_data(item.session_id) for item in sessions]
 
     def get_session(self, *, session_id: str) -> TeachSessionData:
+        self.flush_events(session_id=session_id)
         with self._session_factory() as session:
             repo = TeachSessionRepository(session)
             return repo.to_data(session_id)
@@ -43,34 +58,118 @@ class TeachSessionService:
         sensitive: bool = False,
         event_id: str | None = None,
     ) -> TeachSessionData:
-        payload = payload or {}
+        self.record_event(
+            session_id=session_id,
+            event_type=event_type,
+            payload=payload,
+            sensitive=sensitive,
+            event_id=event_id,
+        )
+        return self.get_session(session_id=session_id)
+
+    def record_event(
+        self,
+        *,
+        session_id: str,
+        event_type: TeachEventType,
+        payload: dict[str, object] | None = None,
+        sensitive: bool = False,
+        event_id: str | None = None,
+    ) -> TeachEventData:
+        event = self.queue_event(
+            session_id=session_id,
+            event_type=event_type,
+            payload=payload,
+            sensitive=sensitive,
+            event_id=event_id,
+        )
+        self.flush_events(session_id=session_id)
+        return event
+
+    def queue_event(
+        self,
+        *,
+        session_id: str,
+        event_type: TeachEventType,
+        payload: dict[str, object] | None = None,
+        sensitive: bool = False,
+        event_id: str | None = None,
+    ) -> TeachEventData:
+        self._ensure_recording(session_id)
         event = TeachEventData(
             event_id=event_id or uuid4().hex,
             event_type=event_type,
-            payload=payload,
+            payload=payload or {},
             sensitive=sensitive,
             timestamp=datetime.now(timezone.utc),
         )
+        with self._pending_lock:
+            pending = self._pending_events.setdefault(session_id, [])
+            pending.append(event)
+            should_flush = len(pending) >= EVENT_FLUSH_THRESHOLD
+        if should_flush:
+            self.flush_events(session_id=session_id)
+        return event
+
+    def flush_events(self, *, session_id: str | None = None) -> None:
+        with self._pending_lock:
+            if session_id is None:
+                batches = self._pending_events
+                self._pending_events = {}
+            else:
+                events = self._pending_events.pop(session_id, None)
+                batches = {session_id: events} if events else {}
+
+        # Each session is written on its own so one failing batch cannot hold back the others.
+        write_error: SQLAlchemyError | None = None
+        for batch_session_id, events in batches.items():
+            try:
+                with self._session_factory() as session:
+                    TeachSessionRepository(session).add_events(session_id=batch_session_id, events=events)
+            except SQLAlchemyError as exc:
+                self._requeue_events(batch_session_id, events)
+                write_error = write_error or exc
+            except ValueError as exc:
+                self._forget_session(batch_session_id)
+                LOGGER.warning("Dropped %d queued teach events: %s", len(events), exc)
+        if write_error is not None:
+            raise write_error
 
+    def _ensure_recording(self, session_id: str) -> None:
+        with self._pending_lock:
+            if session_id in self._recording_session_ids:
+                return
         with self._session_factory() as session:
-            repo = TeachSessionRepository(session)
-            repo.add_event(session_id=session_id, event=event)
-            return repo.to_data(session_id)
+            TeachSessionRepository(session).get_recording_session(session_id)
+        with self._pending_lock:
+            self._recording_session_ids.add(session_id)
+
+    def _forget_session(self, session_id: str) -> None:
+        with self._pending_lock:
+            self._recording_session_ids.discard(session_id)
+
+    def _requeue_events(self, session_id: str, events: list[TeachEventData]) -> None:
+        # A failed batch goes back ahead of anything queued while the write was in flight.
+        with self._pending_lock:
+            self._pending_events[session_id] = events + self._pending_events.get(session_id, [])
 
     def finish_session(self, *, session_id: str) -> TeachSessionData:
+        self.flush_events(session_id=session_id)
+        self._forget_session(session_id)
         with self._session_factory() as session:
             repo = TeachSessionRepository(session)
             repo.finish_session(session_id)
             return repo.to_data(session_id)
 
     def export_session(self, *, session_id: str, output_file: str | Path) -> Path:
+        self.flush_events(session_id=session_id)
         with self._session_factory() as session:
             repo = TeachSessionRepository(session)
             data = repo.to_data(session_id)
 
         output_path = Path(output_file)
         output_path.parent.mkdir(parents=True, exist_ok=True)
-        output_path.write_text(json.dumps(data.model_dump(mode="json"), indent=2), encoding="utf-8")
+        output_path.write_text(data.model_dump_json(indent=2), encoding="utf-8")
         return output_path
 
     def artifacts_dir(self) -> Path:
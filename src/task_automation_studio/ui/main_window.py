@@ -1,11 +1,15 @@
 from __future__ import annotations
 
-import json
 import sys
-from pathlib import Path
+import threading
+from collections.abc import Callable, Sequence
+from typing import TYPE_CHECKING, Any
 
-from PySide6.QtCore import QTimer
+import orjson
+from PySide6.QtCore import QModelIndex, QObject, QRunnable, QStringListModel, Qt, QThreadPool, QTimer, Signal
+from PySide6.QtGui import QAction, QStandardItem, QStandardItemModel, QTextCursor
 from PySide6.QtWidgets import (
+    QAbstractItemView,
     QApplication,
     QCheckBox,
     QComboBox,
@@ -18,30 +22,248 @@ from PySide6.QtWidgets import (
     QLineEdit,
     QMainWindow,
     QMessageBox,
+    QPlainTextEdit,
     QPushButton,
     QSpinBox,
+    QStyle,
     QTabWidget,
     QTextEdit,
+    QTreeView,
     QVBoxLayout,
     QWidget,
 )
 
 from task_automation_studio.config.settings import Settings
-from task_automation_studio.core.teach_models import TeachEventType
+from task_automation_studio.core.teach_models import TeachEventType, TeachSessionData
 from task_automation_studio.services.auto_recorder import AutoTeachRecorder
 from task_automation_studio.services.executors import EmailRuntimeConfig
-from task_automation_studio.services.runner import AutomationRunner
 from task_automation_studio.services.session_compiler import TeachSessionCompiler
 from task_automation_studio.services.session_replay import TeachSessionReplayer
 from task_automation_studio.services.teach_sessions import TeachSessionService
 from task_automation_studio.workflows.loader import summarize_workflow
 from task_automation_studio.workflows.registry import list_available_workflows, load_workflow_from_source
 
+if TYPE_CHECKING:
+    from task_automation_studio.services.runner import AutomationRunner, RunSummary
+
+
+_TEACH_EVENT_TYPE_VALUES: tuple[str, ...] = tuple(item.value for item in TeachEventType)
+_MAX_TEACH_OUTPUT_LINES = 20_000
+_SESSION_COLUMNS = ("Session id", "Name", "Status", "Started", "Events")
+
+
+def _dumps(payload: Any) -> str:
+    return orjson.dumps(payload, option=orjson.OPT_INDENT_2).decode()
+
+
+class _MessageBoxes:
+    """Lazily created message boxes, reused per severity."""
+
+    def __init__(self, parent: QWidget) -> None:
+        self._parent = parent
+        self._boxes: dict[QMessageBox.Icon, QMessageBox] = {}
+
+    def information(self, title: str, text: str) -> None:
+        self._exec(QMessageBox.Icon.Information, title, text)
+
+    def warning(self, title: str, text: str) -> None:
+        self._exec(QMessageBox.Icon.Warning, title, text)
+
+    def critical(self, title: str, text: str) -> None:
+        self._exec(QMessageBox.Icon.Critical, title, text)
+
+    def question(self, title: str, text: str) -> bool:
+        buttons = QMessageBox.StandardButton.Yes | QMessageBox.StandardButton.No
+        box = self._box(QMessageBox.Icon.Question, buttons)
+        box.setDefaultButton(QMessageBox.StandardButton.No)
+        box.setWindowTitle(title)
+        box.setText(text)
+        return box.exec() == QMessageBox.StandardButton.Yes
+
+    def _exec(self, icon: QMessageBox.Icon, title: str, text: str) -> None:
+        box = self._box(icon, QMessageBox.StandardButton.Ok)
+        box.setWindowTitle(title)
+        box.setText(text)
+        box.exec()
+
+    def _box(self, icon: QMessageBox.Icon, buttons: QMessageBox.StandardButton) -> QMessageBox:
+        box = self._boxes.get(icon)
+        if box is None:
+            box = QMessageBox(icon, "", "", buttons, self._parent)
+            self._boxes[icon] = box
+        return box
+
+
+class _ChunkedTextWriter(QObject):
+    """Writes large text into a text edit in slices so the event loop keeps running."""
+
+    _CHUNK_CHARS = 64 * 1024
+
+    def __init__(self, output: QTextEdit | QPlainTextEdit, *, max_appended_lines: int | None = None) -> None:
+        super().__init__(output)
+        self._output = output
+        self._pending: list[str] = []
+        self._max_appended_lines = max_appended_lines
+        self._log_start_block: int | None = None
+        self._appended_lines = 0
+        self._timer = QTimer(self)
+        self._timer.setInterval(0)
+        self._timer.timeout.connect(self._write_next_chunk)
+
+    def write(self, text: str) -> None:
+        self._timer.stop()
+        self._log_start_block = None
+        self._appended_lines = 0
+        size = self._CHUNK_CHARS
+        self._pending = [text[start : start + size] for start in range(size, len(text), size)]
+        self._pending.reverse()
+        self._output.setPlainText(text[:size])
+        if self._pending:
+            self._timer.start()
+
+    def append(self, line: str) -> None:
+        # Pending slices of an earlier write are flushed first so lines stay in order.
+        self._timer.stop()
+        cursor = QTextCursor(self._output.document())
+        cursor.movePosition(QTextCursor.MoveOperation.End)
+        while self._pending:
+            cursor.insertText(self._pending.pop())
+        document = self._output.document()
+        if self._log_start_block is None:
+            self._log_start_block = 0 if document.isEmpty() else document.blockCount()
+        if not document.isEmpty():
+            cursor.insertText("\n")
+        cursor.insertText(line)
+        self._appended_lines += 1
+        if self._max_appended_lines is not None and self._appended_lines > self._max_appended_lines:
+            self._drop_oldest_appended_line()
+
+    def _drop_oldest_appended_line(self) -> None:
+        # Only appended lines are trimmed; the text from the last write() stays intact above them.
+        cursor = QTextCursor(self._output.document().findBlockByNumber(self._log_start_block or 0))
+        cursor.movePosition(QTextCursor.MoveOperation.NextBlock, QTextCursor.MoveMode.KeepAnchor)
+        cursor.removeSelectedText()
+        self._appended_lines -= 1
+
+    def _write_next_chunk(self) -> None:
+        if not self._pending:
+            self._timer.stop()
+            return
+        cursor = QTextCursor(self._output.document())
+        cursor.movePosition(QTextCursor.MoveOperation.End)
+        cursor.insertText(self._pending.pop())
+
+
+def _set_combo_items(combo: QComboBox, items: Sequence[str]) -> None:
+    # Swap the whole model in one go; signals and repaints are suppressed meanwhile.
+    combo.setInsertPolicy(QComboBox.InsertPolicy.NoInsert)
+    combo.blockSignals(True)
+    combo.setUpdatesEnabled(False)
+    try:
+        combo.setModel(QStringListModel(list(items), combo))
+    finally:
+        combo.setUpdatesEnabled(True)
+        combo.blockSignals(False)
+
+
+def _hbox_layout(*widgets: QWidget) -> QHBoxLayout:
+    row_layout = QHBoxLayout()
+    row_layout.setContentsMargins(0, 0, 0, 0)
+    for widget in widgets:
+        row_layout.addWidget(widget)
+    return row_layout
+
+
+def _add_browse_action(line_edit: QLineEdit, on_browse: Callable[[], None]) -> QAction:
+    icon = line_edit.style().standardIcon(QStyle.StandardPixmap.SP_DirOpenIcon)
+    action = line_edit.addAction(icon, QLineEdit.ActionPosition.TrailingPosition)
+    action.setToolTip("Browse...")
+    action.triggered.connect(on_browse)
+    return action
+
+
+def _open_file_dialog(
+    parent: QWidget,
+    target: QLineEdit,
+    *,
+    caption: str,
+    name_filter: str,
+    save: bool = False,
+) -> None:
+    # open() keeps the event loop responsive instead of blocking like the static helpers.
+    dialog = QFileDialog(parent, caption, "", name_filter)
+    # Skips per-folder icon lookups, which are slow on large or network directories.
+    dialog.setOption(QFileDialog.Option.DontUseCustomDirectoryIcons)
+    if save:
+        dialog.setAcceptMode(QFileDialog.AcceptMode.AcceptSave)
+    else:
+        dialog.setFileMode(QFileDialog.FileMode.ExistingFile)
+    dialog.setAttribute(Qt.WidgetAttribute.WA_DeleteOnClose)
+    dialog.fileSelected.connect(target.setText)
+    dialog.open()
+
+
+class _RunWorkerSignals(QObject):
+    progress = Signal(int, str)
+    finished = Signal(str, object)
+    failed = Signal(str)
+
+
+class _RunWorker(QRunnable):
+    def __init__(
+        self,
+        *,
+        runner_provider: Callable[[], AutomationRunner],
+        workflow_name: str | None,
+        workflow_file: str | None,
+        input_file: str,
+        output_file: str | None,
+        report_file: str | None,
+        dry_run: bool,
+        safe_stop_error_rate: float,
+        email_config: EmailRuntimeConfig,
+    ) -> None:
+        super().__init__()
+        self.signals = _RunWorkerSignals()
+        self.stop_event = threading.Event()
+        self._runner_provider = runner_provider
+        self._workflow_name = workflow_name
+        self._workflow_file = workflow_file
+        self._input_file = input_file
+        self._output_file = output_file
+        self._report_file = report_file
+        self._dry_run = dry_run
+        self._safe_stop_error_rate = safe_stop_error_rate
+        self._email_config = email_config
+
+    def run(self) -> None:
+        try:
+            workflow = load_workflow_from_source(workflow_name=self._workflow_name, workflow_file=self._workflow_file)
+            runner = self._runner_provider()
+            summary = runner.run_excel_workflow(
+                workflow=workflow,
+                input_file=self._input_file,
+                output_file=self._output_file,
+                report_file=self._report_file,
+                dry_run=self._dry_run,
+                safe_stop_error_rate=self._safe_stop_error_rate,
+                email_config=self._email_config,
+                progress_callback=self.signals.progress.emit,
+                stop_event=self.stop_event,
+            )
+        except Exception as exc:
+            self.signals.failed.emit(str(exc))
+            return
+        self.signals.finished.emit(_dumps(summary.to_dict()), summary)
+
 
 class RunWorkflowTab(QWidget):
     def __init__(self, settings: Settings, parent: QWidget | None = None) -> None:
         super().__init__(parent)
         self._settings = settings
+        self._messages = _MessageBoxes(self)
+        self._run_worker: _RunWorker | None = None
+        self._runner: AutomationRunner | None = None
         self._build_ui()
 
     def _build_ui(self) -> None:
@@ -51,55 +273,31 @@ class RunWorkflowTab(QWidget):
         workflow_form = QFormLayout(workflow_group)
 
         self.workflow_combo = QComboBox()
-        self.workflow_combo.addItems(list_available_workflows())
+        _set_combo_items(self.workflow_combo, list_available_workflows())
         workflow_form.addRow("Built-in workflow", self.workflow_combo)
 
         self.workflow_file_input = QLineEdit()
         self.workflow_file_input.setPlaceholderText("Optional: use workflow JSON file instead of built-in workflow")
-        self.workflow_file_button = QPushButton("Browse...")
-        self.workflow_file_button.clicked.connect(self._browse_workflow_file)
-        workflow_file_row = QWidget()
-        workflow_file_layout = QHBoxLayout(workflow_file_row)
-        workflow_file_layout.setContentsMargins(0, 0, 0, 0)
-        workflow_file_layout.addWidget(self.workflow_file_input)
-        workflow_file_layout.addWidget(self.workflow_file_button)
-        workflow_form.addRow("Workflow file", workflow_file_row)
+        self.workflow_file_action = _add_browse_action(self.workflow_file_input, self._browse_workflow_file)
+        workflow_form.addRow("Workflow file", self.workflow_file_input)
         layout.addWidget(workflow_group)
 
         io_group = QGroupBox("Input and Output")
         io_form = QFormLayout(io_group)
 
         self.input_file_input = QLineEdit()
-        self.input_file_button = QPushButton("Browse...")
-        self.input_file_button.clicked.connect(self._browse_input_file)
-        input_row = QWidget()
-        input_layout = QHBoxLayout(input_row)
-        input_layout.setContentsMargins(0, 0, 0, 0)
-        input_layout.addWidget(self.input_file_input)
-        input_layout.addWidget(self.input_file_button)
-        io_form.addRow("Input Excel", input_row)
+        self.input_file_action = _add_browse_action(self.input_file_input, self._browse_input_file)
+        io_form.addRow("Input Excel", self.input_file_input)
 
         self.output_file_input = QLineEdit()
         self.output_file_input.setPlaceholderText("Optional: custom output Excel path")
-        self.output_file_button = QPushButton("Browse...")
-        self.output_file_button.clicked.connect(self._browse_output_file)
-        output_row = QWidget()
-        output_layout = QHBoxLayout(output_row)
-        output_layout.setContentsMargins(0, 0, 0, 0)
-        output_layout.addWidget(self.output_file_input)
-        output_layout.addWidget(self.output_file_button)
-        io_form.addRow("Output Excel", output_row)
+        self.output_file_action = _add_browse_action(self.output_file_input, self._browse_output_file)
+        io_form.addRow("Output Excel", self.output_file_input)
 
         self.report_file_input = QLineEdit()
         self.report_file_input.setPlaceholderText("Optional: custom JSON report path")
-        self.report_file_button = QPushButton("Browse...")
-        self.report_file_button.clicked.connect(self._browse_report_file)
-        report_row = QWidget()
-        report_layout = QHBoxLayout(report_row)
-        report_layout.setContentsMargins(0, 0, 0, 0)
-        report_layout.addWidget(self.report_file_input)
-        report_layout.addWidget(self.report_file_button)
-        io_form.addRow("Report JSON", report_row)
+        self.report_file_action = _add_browse_action(self.report_file_input, self._browse_report_file)
+        io_form.addRow("Report JSON", self.report_file_input)
 
         layout.addWidget(io_group)
 
@@ -131,37 +329,55 @@ class RunWorkflowTab(QWidget):
 
         self.run_button = QPushButton("Run Workflow")
         self.run_button.clicked.connect(self._run_workflow)
-        layout.addWidget(self.run_button)
+        self.stop_button = QPushButton("Stop")
+        self.stop_button.setEnabled(False)
+        self.stop_button.clicked.connect(self._stop_workflow)
+        layout.addLayout(_hbox_layout(self.run_button, self.stop_button))
 
         self.result_output = QTextEdit()
         self.result_output.setReadOnly(True)
         self.result_output.setPlaceholderText("Run summary will appear here.")
+        self._output_writer = _ChunkedTextWriter(self.result_output)
         layout.addWidget(self.result_output)
 
     def _browse_workflow_file(self) -> None:
-        path, _ = QFileDialog.getOpenFileName(self, "Select workflow JSON", "", "JSON Files (*.json);;All Files (*)")
-        if path:
-            self.workflow_file_input.setText(path)
+        _open_file_dialog(
+            self,
+            self.workflow_file_input,
+            caption="Select workflow JSON",
+            name_filter="JSON Files (*.json);;All Files (*)",
+        )
 
     def _browse_input_file(self) -> None:
-        path, _ = QFileDialog.getOpenFileName(self, "Select input Excel", "", "Excel Files (*.xlsx *.xlsm);;All Files (*)")
-        if path:
-            self.input_file_input.setText(path)
+        _open_file_dialog(
+            self,
+            self.input_file_input,
+            caption="Select input Excel",
+            name_filter="Excel Files (*.xlsx *.xlsm);;All Files (*)",
+        )
 
     def _browse_output_file(self) -> None:
-        path, _ = QFileDialog.getSaveFileName(self, "Select output Excel", "", "Excel Files (*.xlsx);;All Files (*)")
-        if path:
-            self.output_file_input.setText(path)
+        _open_file_dialog(
+            self,
+            self.output_file_input,
+            caption="Select output Excel",
+            name_filter="Excel Files (*.xlsx);;All Files (*)",
+            save=True,
+        )
 
     def _browse_report_file(self) -> None:
-        path, _ = QFileDialog.getSaveFileName(self, "Select report JSON", "", "JSON Files (*.json);;All Files (*)")
-        if path:
-            self.report_file_input.setText(path)
+        _open_file_dialog(
+            self,
+            self.report_file_input,
+            caption="Select report JSON",
+            name_filter="JSON Files (*.json);;All Files (*)",
+            save=True,
+        )
 
     def _run_workflow(self) -> None:
         input_file = self.input_file_input.text().strip()
         if not input_file:
-            QMessageBox.warning(self, "Missing Input", "Please select input Excel file.")
+            self._messages.warning("Missing Input", "Please select input Excel file.")
             return
 
         workflow_file = self.workflow_file_input.text().strip()
@@ -171,36 +387,74 @@ class RunWorkflowTab(QWidget):
         dry_run = self.dry_run_checkbox.isChecked()
         safe_stop = float(self.safe_stop_input.value())
 
+        email_host = self.email_host_input.text().strip()
+        email_username = self.email_username_input.text().strip()
+        email_password = self.email_password_input.text().strip()
         email_config = EmailRuntimeConfig(
-            enabled=bool(
-                self.email_host_input.text().strip()
-                and self.email_username_input.text().strip()
-                and self.email_password_input.text().strip()
-            ),
-            host=self.email_host_input.text().strip(),
-            username=self.email_username_input.text().strip(),
-            password=self.email_password_input.text().strip(),
+            enabled=bool(email_host and email_username and email_password),
+            host=email_host,
+            username=email_username,
+            password=email_password,
             folder=self.email_folder_input.text().strip() or "INBOX",
         )
 
-        try:
-            workflow = load_workflow_from_source(workflow_name=workflow_name, workflow_file=workflow_file or None)
-            runner = AutomationRunner(settings=self._settings)
-            summary = runner.run_excel_workflow(
-                workflow=workflow,
-                input_file=Path(input_file),
-                output_file=Path(output_file) if output_file else None,
-                report_file=Path(report_file) if report_file else None,
-                dry_run=dry_run,
-                safe_stop_error_rate=safe_stop,
-                email_config=email_config,
+        self._output_writer.write("")
+        self.run_button.setEnabled(False)
+        self.stop_button.setEnabled(True)
+        worker = _RunWorker(
+            runner_provider=self._get_runner,
+            workflow_name=workflow_name,
+            workflow_file=workflow_file or None,
+            input_file=input_file,
+            output_file=output_file,
+            report_file=report_file,
+            dry_run=dry_run,
+            safe_stop_error_rate=safe_stop,
+            email_config=email_config,
+        )
+        worker.signals.progress.connect(self._on_run_progress)
+        worker.signals.finished.connect(self._on_run_finished)
+        worker.signals.failed.connect(self._on_run_failed)
+        self._run_worker = worker
+        QThreadPool.globalInstance().start(worker)
+
+    def _get_runner(self) -> AutomationRunner:
+        # Called on the worker thread; runs never overlap because the Run button stays disabled.
+        if self._runner is None:
+            # Imported here so pandas/openpyxl load on the first run, not at UI startup.
+            from task_automation_studio.services.runner import AutomationRunner
+
+            self._runner = AutomationRunner(settings=self._settings)
+        return self._runner
+
+    def _on_run_progress(self, processed: int, message: str) -> None:
+        self.result_output.append(f"[{processed}] {message}")
+
+    def _on_run_finished(self, summary_text: str, summary: RunSummary) -> None:
+        self._release_run_worker()
+        self._output_writer.write(summary_text)
+        if summary.cancelled:
+            self._messages.information(
+                "Run Cancelled",
+                f"Workflow run was stopped after {summary.processed_records} of {summary.total_records} records.",
             )
-        except Exception as exc:
-            QMessageBox.critical(self, "Run Failed", str(exc))
             return
+        self._messages.information("Run Completed", "Workflow run completed successfully.")
+
+    def _on_run_failed(self, message: str) -> None:
+        self._release_run_worker()
+        self._messages.critical("Run Failed", message)
+
+    def _stop_workflow(self) -> None:
+        # The runner checks the event between records, so the current record finishes first.
+        if self._run_worker is not None:
+            self._run_worker.stop_event.set()
+            self.stop_button.setEnabled(False)
 
-        self.result_output.setPlainText(json.dumps(summary.to_dict(), indent=2))
-        QMessageBox.information(self, "Run Completed", "Workflow run completed successfully.")
+    def _release_run_worker(self) -> None:
+        self._run_worker = None
+        self.run_button.setEnabled(True)
+        self.stop_button.setEnabled(False)
 
 
 class TeachSessionTab(QWidget):
@@ -212,6 +466,8 @@ class TeachSessionTab(QWidget):
         self._auto_recorder = AutoTeachRecorder(session_service=self._service)
         self._active_record_session_id: str | None = None
         self._record_status = "idle"
+        self._session_text_cache: dict[str, tuple[tuple[int, str], str]] = {}
+        self._messages = _MessageBoxes(self)
         self._poll_timer = QTimer(self)
         self._poll_timer.setInterval(500)
         self._poll_timer.timeout.connect(self._poll_recorder_state)
@@ -231,12 +487,7 @@ class TeachSessionTab(QWidget):
         self.start_auto_button.clicked.connect(self._start_auto_record)
         self.stop_auto_button = QPushButton("Stop Auto Record")
         self.stop_auto_button.clicked.connect(self._stop_auto_record)
-        auto_btn_row = QWidget()
-        auto_btn_layout = QHBoxLayout(auto_btn_row)
-        auto_btn_layout.setContentsMargins(0, 0, 0, 0)
-        auto_btn_layout.addWidget(self.start_auto_button)
-        auto_btn_layout.addWidget(self.stop_auto_button)
-        auto_form.addRow("", auto_btn_row)
+        auto_form.addRow("", _hbox_layout(self.start_auto_button, self.stop_auto_button))
         layout.addWidget(auto_group)
 
         start_group = QGroupBox("Start Session")
@@ -244,12 +495,7 @@ class TeachSessionTab(QWidget):
         self.session_name_input = QLineEdit()
         self.start_button = QPushButton("Start")
         self.start_button.clicked.connect(self._start_session)
-        start_row = QWidget()
-        start_layout = QHBoxLayout(start_row)
-        start_layout.setContentsMargins(0, 0, 0, 0)
-        start_layout.addWidget(self.session_name_input)
-        start_layout.addWidget(self.start_button)
-        start_form.addRow("Session name", start_row)
+        start_form.addRow("Session name", _hbox_layout(self.session_name_input, self.start_button))
         layout.addWidget(start_group)
 
         event_group = QGroupBox("Record Event")
@@ -258,19 +504,14 @@ class TeachSessionTab(QWidget):
         event_form.addRow("Session id", self.session_id_input)
 
         self.event_type_combo = QComboBox()
-        self.event_type_combo.addItems([item.value for item in TeachEventType])
+        _set_combo_items(self.event_type_combo, _TEACH_EVENT_TYPE_VALUES)
         event_form.addRow("Event type", self.event_type_combo)
 
         self.payload_key_input = QLineEdit()
         self.payload_key_input.setPlaceholderText("selector")
         self.payload_value_input = QLineEdit()
         self.payload_value_input.setPlaceholderText("input[name='email']")
-        payload_row = QWidget()
-        payload_layout = QHBoxLayout(payload_row)
-        payload_layout.setContentsMargins(0, 0, 0, 0)
-        payload_layout.addWidget(self.payload_key_input)
-        payload_layout.addWidget(self.payload_value_input)
-        event_form.addRow("Payload key/value", payload_row)
+        event_form.addRow("Payload key/value", _hbox_layout(self.payload_key_input, self.payload_value_input))
 
         self.sensitive_checkbox = QCheckBox("Sensitive event")
         event_form.addRow("Flags", self.sensitive_checkbox)
@@ -285,12 +526,7 @@ class TeachSessionTab(QWidget):
         self.checkpoint_name_input = QLineEdit()
         self.checkpoint_button = QPushButton("Add Checkpoint")
         self.checkpoint_button.clicked.connect(self._add_checkpoint)
-        checkpoint_row = QWidget()
-        checkpoint_layout = QHBoxLayout(checkpoint_row)
-        checkpoint_layout.setContentsMargins(0, 0, 0, 0)
-        checkpoint_layout.addWidget(self.checkpoint_name_input)
-        checkpoint_layout.addWidget(self.checkpoint_button)
-        checkpoint_form.addRow("Checkpoint name", checkpoint_row)
+        checkpoint_form.addRow("Checkpoint name", _hbox_layout(self.checkpoint_name_input, self.checkpoint_button))
         layout.addWidget(checkpoint_group)
 
         actions_group = QGroupBox("Session Actions")
@@ -298,24 +534,16 @@ class TeachSessionTab(QWidget):
         self.finish_button = QPushButton("Finish Session")
         self.finish_button.clicked.connect(self._finish_session)
         actions_form.addRow("", self.finish_button)
+        self.show_session_button = QPushButton("Show Session")
+        self.show_session_button.clicked.connect(self._show_session)
+        actions_form.addRow("", self.show_session_button)
 
         self.export_file_input = QLineEdit()
         self.export_file_input.setPlaceholderText("artifacts/session.json")
-        self.export_file_button = QPushButton("Browse...")
-        self.export_file_button.clicked.connect(self._browse_export_file)
-        export_row = QWidget()
-        export_layout = QHBoxLayout(export_row)
-        export_layout.setContentsMargins(0, 0, 0, 0)
-        export_layout.addWidget(self.export_file_input)
-        export_layout.addWidget(self.export_file_button)
+        self.export_file_action = _add_browse_action(self.export_file_input, self._browse_export_file)
         self.export_button = QPushButton("Export Session")
         self.export_button.clicked.connect(self._export_session)
-        export_action_row = QWidget()
-        export_action_layout = QHBoxLayout(export_action_row)
-        export_action_layout.setContentsMargins(0, 0, 0, 0)
-        export_action_layout.addWidget(export_row)
-        export_action_layout.addWidget(self.export_button)
-        actions_form.addRow("Export file", export_action_row)
+        actions_form.addRow("Export file", _hbox_layout(self.export_file_input, self.export_button))
 
         self.compile_workflow_id_input = QLineEdit()
         self.compile_workflow_id_input.setPlaceholderText("employee_signup_v1")
@@ -323,21 +551,10 @@ class TeachSessionTab(QWidget):
 
         self.compile_file_input = QLineEdit()
         self.compile_file_input.setPlaceholderText("artifacts/employee_signup_v1.workflow.json")
-        self.compile_file_button = QPushButton("Browse...")
-        self.compile_file_button.clicked.connect(self._browse_compile_file)
-        compile_row = QWidget()
-        compile_layout = QHBoxLayout(compile_row)
-        compile_layout.setContentsMargins(0, 0, 0, 0)
-        compile_layout.addWidget(self.compile_file_input)
-        compile_layout.addWidget(self.compile_file_button)
+        self.compile_file_action = _add_browse_action(self.compile_file_input, self._browse_compile_file)
         self.compile_button = QPushButton("Compile Session")
         self.compile_button.clicked.connect(self._compile_session)
-        compile_action_row = QWidget()
-        compile_action_layout = QHBoxLayout(compile_action_row)
-        compile_action_layout.setContentsMargins(0, 0, 0, 0)
-        compile_action_layout.addWidget(compile_row)
-        compile_action_layout.addWidget(self.compile_button)
-        actions_form.addRow("Compile file", compile_action_row)
+        actions_form.addRow("Compile file", _hbox_layout(self.compile_file_input, self.compile_button))
 
         self.list_button = QPushButton("List Sessions")
         self.list_button.clicked.connect(self._list_sessions)
@@ -357,31 +574,42 @@ class TeachSessionTab(QWidget):
         actions_form.addRow("", self.replay_button)
         layout.addWidget(actions_group)
 
-        self.result_output = QTextEdit()
+        self.sessions_model = QStandardItemModel(0, len(_SESSION_COLUMNS), self)
+        self.sessions_model.setHorizontalHeaderLabels(list(_SESSION_COLUMNS))
+        self.sessions_view = QTreeView()
+        self.sessions_view.setModel(self.sessions_model)
+        self.sessions_view.setRootIsDecorated(False)
+        self.sessions_view.setUniformRowHeights(True)
+        self.sessions_view.setEditTriggers(QAbstractItemView.EditTrigger.NoEditTriggers)
+        self.sessions_view.activated.connect(self._select_listed_session)
+        layout.addWidget(self.sessions_view)
+
+        self.result_output = QPlainTextEdit()
         self.result_output.setReadOnly(True)
         self.result_output.setPlaceholderText("Teach session output will appear here.")
+        self._output_writer = _ChunkedTextWriter(self.result_output, max_appended_lines=_MAX_TEACH_OUTPUT_LINES)
         layout.addWidget(self.result_output)
 
     def _start_session(self) -> None:
         name = self.session_name_input.text().strip()
         if not name:
-            QMessageBox.warning(self, "Missing Name", "Please provide session name.")
+            self._messages.warning("Missing Name", "Please provide session name.")
             return
         try:
             session = self._service.start_session(name=name)
         except Exception as exc:
-            QMessageBox.critical(self, "Start Failed", str(exc))
+            self._messages.critical("Start Failed", str(exc))
             return
         self.session_id_input.setText(session.session_id)
-        self.result_output.setPlainText(json.dumps(session.model_dump(mode="json"), indent=2))
+        self._output_writer.write(self._render_session(session))
 
     def _start_auto_record(self) -> None:
         if self._auto_recorder.is_recording:
-            QMessageBox.warning(self, "Recorder Busy", "Auto recorder is already running.")
+            self._messages.warning("Recorder Busy", "Auto recorder is already running.")
             return
         name = self.auto_name_input.text().strip() or self.session_name_input.text().strip()
         if not name:
-            QMessageBox.warning(self, "Missing Name", "Please provide session name for auto recorder.")
+            self._messages.warning("Missing Name", "Please provide session name for auto recorder.")
             return
         try:
             session = self._service.start_session(name=name)
@@ -391,14 +619,14 @@ class TeachSessionTab(QWidget):
             self._record_status = "recording"
             self.auto_status_label.setText("Status: recording (press ESC to stop)")
             self._poll_timer.start()
-            self.result_output.setPlainText(json.dumps(session.model_dump(mode="json"), indent=2))
+            self._output_writer.write(self._render_session(session))
             self._minimize_host_window()
         except Exception as exc:
-            QMessageBox.critical(self, "Auto Record Failed", str(exc))
+            self._messages.critical("Auto Record Failed", str(exc))
 
     def _stop_auto_record(self) -> None:
         if not self._auto_recorder.is_recording:
-            QMessageBox.information(self, "Auto Recorder", "Recorder is not running.")
+            self._messages.information("Auto Recorder", "Recorder is not running.")
             return
         try:
             self._auto_recorder.stop(finish_session=True)
@@ -408,9 +636,9 @@ class TeachSessionTab(QWidget):
             self._restore_host_window()
             if self._active_record_session_id:
                 session = self._service.get_session(session_id=self._active_record_session_id)
-                self.result_output.setPlainText(json.dumps(session.model_dump(mode="json"), indent=2))
+                self._output_writer.write(self._render_session(session))
         except Exception as exc:
-            QMessageBox.critical(self, "Stop Failed", str(exc))
+            self._messages.critical("Stop Failed", str(exc))
 
     def _poll_recorder_state(self) -> None:
         if self._record_status != "recording":
@@ -426,12 +654,12 @@ class TeachSessionTab(QWidget):
                 session = self._service.get_session(session_id=self._active_record_session_id)
             except Exception:
                 return
-            self.result_output.setPlainText(json.dumps(session.model_dump(mode="json"), indent=2))
+            self._output_writer.write(self._render_session(session))
 
     def _add_event(self) -> None:
         session_id = self.session_id_input.text().strip()
         if not session_id:
-            QMessageBox.warning(self, "Missing Session ID", "Please provide session id.")
+            self._messages.warning("Missing Session ID", "Please provide session id.")
             return
 
         payload: dict[str, object] = {}
@@ -441,81 +669,96 @@ class TeachSessionTab(QWidget):
             payload[key] = value
 
         try:
-            session = self._service.add_event(
+            event = self._service.record_event(
                 session_id=session_id,
                 event_type=TeachEventType(self.event_type_combo.currentText()),
                 payload=payload,
                 sensitive=self.sensitive_checkbox.isChecked(),
             )
         except Exception as exc:
-            QMessageBox.critical(self, "Add Event Failed", str(exc))
+            self._messages.critical("Add Event Failed", str(exc))
             return
-        self.result_output.setPlainText(json.dumps(session.model_dump(mode="json"), indent=2))
+        self._output_writer.append(event.model_dump_json())
 
     def _add_checkpoint(self) -> None:
         session_id = self.session_id_input.text().strip()
         name = self.checkpoint_name_input.text().strip()
         if not session_id or not name:
-            QMessageBox.warning(self, "Missing Data", "Provide session id and checkpoint name.")
+            self._messages.warning("Missing Data", "Provide session id and checkpoint name.")
             return
         try:
-            session = self._service.add_event(
+            event = self._service.record_event(
                 session_id=session_id,
                 event_type=TeachEventType.CHECKPOINT,
                 payload={"name": name},
                 sensitive=False,
             )
         except Exception as exc:
-            QMessageBox.critical(self, "Checkpoint Failed", str(exc))
+            self._messages.critical("Checkpoint Failed", str(exc))
             return
-        self.result_output.setPlainText(json.dumps(session.model_dump(mode="json"), indent=2))
+        self._output_writer.append(event.model_dump_json())
 
     def _finish_session(self) -> None:
         session_id = self.session_id_input.text().strip()
         if not session_id:
-            QMessageBox.warning(self, "Missing Session ID", "Please provide session id.")
+            self._messages.warning("Missing Session ID", "Please provide session id.")
             return
         try:
             session = self._service.finish_session(session_id=session_id)
         except Exception as exc:
-            QMessageBox.critical(self, "Finish Failed", str(exc))
+            self._messages.critical("Finish Failed", str(exc))
+            return
+        self._output_writer.write(self._render_session(session))
+
+    def _show_session(self) -> None:
+        session_id = self.session_id_input.text().strip()
+        if not session_id:
+            self._messages.warning("Missing Session ID", "Please provide session id.")
+            return
+        try:
+            session = self._service.get_session(session_id=session_id)
+        except Exception as exc:
+            self._messages.critical("Show Session Failed", str(exc))
             return
-        self.result_output.setPlainText(json.dumps(session.model_dump(mode="json"), indent=2))
+        self._output_writer.write(self._render_session(session))
 
     def _browse_export_file(self) -> None:
-        path, _ = QFileDialog.getSaveFileName(self, "Select session export file", "", "JSON Files (*.json);;All Files (*)")
-        if path:
-            self.export_file_input.setText(path)
+        _open_file_dialog(
+            self,
+            self.export_file_input,
+            caption="Select session export file",
+            name_filter="JSON Files (*.json);;All Files (*)",
+            save=True,
+        )
 
     def _export_session(self) -> None:
         session_id = self.session_id_input.text().strip()
         output_file = self.export_file_input.text().strip()
         if not session_id or not output_file:
-            QMessageBox.warning(self, "Missing Data", "Provide session id and export file.")
+            self._messages.warning("Missing Data", "Provide session id and export file.")
             return
         try:
             output = self._service.export_session(session_id=session_id, output_file=output_file)
         except Exception as exc:
-            QMessageBox.critical(self, "Export Failed", str(exc))
+            self._messages.critical("Export Failed", str(exc))
             return
-        self.result_output.setPlainText(json.dumps({"session_id": session_id, "output_file": str(output)}, indent=2))
+        self._output_writer.write(_dumps({"session_id": session_id, "output_file": str(output)}))
 
     def _browse_compile_file(self) -> None:
-        path, _ = QFileDialog.getSaveFileName(
+        _open_file_dialog(
             self,
-            "Select compiled workflow file",
-            "",
-            "JSON Files (*.json);;All Files (*)",
+            self.compile_file_input,
+            caption="Select compiled workflow file",
+            name_filter="JSON Files (*.json);;All Files (*)",
+            save=True,
         )
-        if path:
-            self.compile_file_input.setText(path)
 
     def _compile_session(self) -> None:
         session_id = self.session_id_input.text().strip()
         workflow_id = self.compile_workflow_id_input.text().strip()
         output_file = self.compile_file_input.text().strip()
         if not session_id or not workflow_id or not output_file:
-            QMessageBox.warning(self, "Missing Data", "Provide session id, workflow id, and output file.")
+            self._messages.warning("Missing Data", "Provide session id, workflow id, and output file.")
             return
         try:
             output = self._compiler.compile_to_workflow(
@@ -524,34 +767,41 @@ class TeachSessionTab(QWidget):
                 output_file=output_file,
             )
         except Exception as exc:
-            QMessageBox.critical(self, "Compile Failed", str(exc))
+            self._messages.critical("Compile Failed", str(exc))
             return
-        self.result_output.setPlainText(
-            json.dumps({"session_id": session_id, "workflow_id": workflow_id, "output_file": str(output)}, indent=2)
+        self._output_writer.write(
+            _dumps({"session_id": session_id, "workflow_id": workflow_id, "output_file": str(output)})
         )
 
     def _list_sessions(self) -> None:
         try:
             sessions = self._service.list_sessions()
         except Exception as exc:
-            QMessageBox.critical(self, "List Failed", str(exc))
+            self._messages.critical("List Failed", str(exc))
             return
-        payload = [item.model_dump(mode="json") for item in sessions]
-        self.result_output.setPlainText(json.dumps(payload, indent=2))
+        self.sessions_view.setUpdatesEnabled(False)
+        try:
+            self.sessions_model.setRowCount(0)
+            for item in sessions:
+                started_at = item.started_at.isoformat(sep=" ", timespec="seconds")
+                row = (item.session_id, item.name, item.status.value, started_at, str(len(item.events)))
+                self.sessions_model.appendRow([QStandardItem(value) for value in row])
+        finally:
+            self.sessions_view.setUpdatesEnabled(True)
+
+    def _select_listed_session(self, index: QModelIndex) -> None:
+        session_id = self.sessions_model.item(index.row(), 0).text()
+        self.session_id_input.setText(session_id)
 
     def _replay_session(self) -> None:
         session_id = self.session_id_input.text().strip()
         if not session_id:
-            QMessageBox.warning(self, "Missing Session ID", "Please provide session id.")
+            self._messages.warning("Missing Session ID", "Please provide session id.")
             return
-        confirm = QMessageBox.question(
-            self,
+        if not self._messages.question(
             "Confirm Replay",
             "Replay will control mouse and keyboard on your computer. Continue?",
-            QMessageBox.StandardButton.Yes | QMessageBox.StandardButton.No,
-            QMessageBox.StandardButton.No,
-        )
-        if confirm != QMessageBox.StandardButton.Yes:
+        ):
             return
         self._minimize_host_window()
         try:
@@ -563,10 +813,20 @@ class TeachSessionTab(QWidget):
             )
         except Exception as exc:
             self._restore_host_window()
-            QMessageBox.critical(self, "Replay Failed", str(exc))
+            self._messages.critical("Replay Failed", str(exc))
             return
         self._restore_host_window()
-        self.result_output.setPlainText(self._format_replay_summary(summary.to_dict()))
+        self._output_writer.write(self._format_replay_summary(summary.to_dict()))
+
+    def _render_session(self, session: TeachSessionData) -> str:
+        # Events are append-only, so event count plus status identifies a session revision.
+        revision = (len(session.events), session.status.value)
+        cached = self._session_text_cache.get(session.session_id)
+        if cached is not None and cached[0] == revision:
+            return cached[1]
+        text = session.model_dump_json(indent=2)
+        self._session_text_cache[session.session_id] = (revision, text)
+        return text
 
     def _format_replay_summary(self, payload: dict[str, object]) -> str:
         diagnostics_raw = payload.get("diagnostics", [])
@@ -596,7 +856,7 @@ class TeachSessionTab(QWidget):
         remaining = len(failed) - len(failed_preview)
         if remaining > 0:
             output["failed_events_remaining"] = remaining
-        return json.dumps(output, indent=2)
+        return _dumps(output)
 
     def _minimize_host_window(self) -> None:
         host = self.window()
@@ -614,6 +874,7 @@ class TeachSessionTab(QWidget):
 class WorkflowToolsTab(QWidget):
     def __init__(self, parent: QWidget | None = None) -> None:
         super().__init__(parent)
+        self._messages = _MessageBoxes(self)
         self._build_ui()
 
     def _build_ui(self) -> None:
@@ -623,14 +884,8 @@ class WorkflowToolsTab(QWidget):
         validate_form = QFormLayout(validate_group)
 
         self.workflow_file_input = QLineEdit()
-        self.workflow_file_button = QPushButton("Browse...")
-        self.workflow_file_button.clicked.connect(self._browse_workflow_file)
-        workflow_row = QWidget()
-        workflow_layout = QHBoxLayout(workflow_row)
-        workflow_layout.setContentsMargins(0, 0, 0, 0)
-        workflow_layout.addWidget(self.workflow_file_input)
-        workflow_layout.addWidget(self.workflow_file_button)
-        validate_form.addRow("Workflow JSON", workflow_row)
+        self.workflow_file_action = _add_browse_action(self.workflow_file_input, self._browse_workflow_file)
+        validate_form.addRow("Workflow JSON", self.workflow_file_input)
 
         self.validate_button = QPushButton("Validate")
         self.validate_button.clicked.connect(self._validate_workflow)
@@ -641,7 +896,7 @@ class WorkflowToolsTab(QWidget):
         info_layout = QVBoxLayout(info_group)
         self.builtin_output = QTextEdit()
         self.builtin_output.setReadOnly(True)
-        self.builtin_output.setPlainText(json.dumps({"available_workflows": list_available_workflows()}, indent=2))
+        QTimer.singleShot(0, self._populate_builtin_workflows)
         info_layout.addWidget(self.builtin_output)
         layout.addWidget(info_group)
 
@@ -651,22 +906,28 @@ class WorkflowToolsTab(QWidget):
         layout.addWidget(self.result_output)
 
     def _browse_workflow_file(self) -> None:
-        path, _ = QFileDialog.getOpenFileName(self, "Select workflow JSON", "", "JSON Files (*.json);;All Files (*)")
-        if path:
-            self.workflow_file_input.setText(path)
+        _open_file_dialog(
+            self,
+            self.workflow_file_input,
+            caption="Select workflow JSON",
+            name_filter="JSON Files (*.json);;All Files (*)",
+        )
+
+    def _populate_builtin_workflows(self) -> None:
+        self.builtin_output.setPlainText(_dumps({"available_workflows": list_available_workflows()}))
 
     def _validate_workflow(self) -> None:
         workflow_file = self.workflow_file_input.text().strip()
         if not workflow_file:
-            QMessageBox.warning(self, "Missing File", "Please select workflow JSON file.")
+            self._messages.warning("Missing File", "Please select workflow JSON file.")
             return
         try:
             summary = summarize_workflow(workflow_file)
         except Exception as exc:
-            QMessageBox.critical(self, "Validation Failed", str(exc))
+            self._messages.critical("Validation Failed", str(exc))
             return
-        self.result_output.setPlainText(json.dumps(summary, indent=2))
-        QMessageBox.information(self, "Validation Completed", "Workflow file is valid.")
+        self.result_output.setPlainText(_dumps(summary))
+        self._messages.information("Validation Completed", "Workflow file is valid.")
 
 
 class MainWindow(QMainWindow):
@@ -675,11 +936,29 @@ class MainWindow(QMainWindow):
         self.setWindowTitle(settings.app_name)
         self.resize(980, 760)
 
-        tabs = QTabWidget()
-        tabs.addTab(RunWorkflowTab(settings=settings), "Run")
-        tabs.addTab(TeachSessionTab(settings=settings), "Teach")
-        tabs.addTab(WorkflowToolsTab(), "Workflow")
-        self.setCentralWidget(tabs)
+        self._tabs = QTabWidget()
+        self._tab_factories: dict[int, Callable[[], QWidget]] = {}
+        self._add_lazy_tab("Run", lambda: RunWorkflowTab(settings=settings))
+        self._add_lazy_tab("Teach", lambda: TeachSessionTab(settings=settings))
+        self._add_lazy_tab("Workflow", WorkflowToolsTab)
+        self._tabs.currentChanged.connect(self._ensure_tab_built)
+        self.setCentralWidget(self._tabs)
+        self._ensure_tab_built(self._tabs.currentIndex())
+
+    def _add_lazy_tab(self, label: str, factory: Callable[[], QWidget]) -> None:
+        container = QWidget()
+        container_layout = QVBoxLayout(container)
+        container_layout.setContentsMargins(0, 0, 0, 0)
+        index = self._tabs.addTab(container, label)
+        self._tab_factories[index] = factory
+
+    def _ensure_tab_built(self, index: int) -> None:
+        # Tabs are constructed on first activation to keep startup cheap.
+        factory = self._tab_factories.pop(index, None)
+        if factory is None:
+            return
+        container = self._tabs.widget(index)
+        container.layout().addWidget(factory())
 
 
 def launch_ui(settings: Settings | None = None) -> int:
@@ -1,18 +1,43 @@
 from __future__ import annotations
 
+import atexit
 import logging
+import queue
+from logging.handlers import QueueHandler, QueueListener, RotatingFileHandler
 from pathlib import Path
 
+LOG_FORMAT = "%(asctime)s | %(levelname)s | %(name)s | %(message)s"
+LOG_MAX_BYTES = 5 * 1024 * 1024
+LOG_BACKUP_COUNT = 5
+
 
 def configure_logging(log_dir: Path) -> None:
     log_dir.mkdir(parents=True, exist_ok=True)
     logfile = log_dir / "app.log"
 
-    logging.basicConfig(
-        level=logging.INFO,
-        format="%(asctime)s | %(levelname)s | %(name)s | %(message)s",
-        handlers=[
-            logging.StreamHandler(),
-            logging.FileHandler(logfile, encoding="utf-8"),
-        ],
+    root = logging.getLogger()
+    if root.handlers:
+        # Same contract as logging.basicConfig: an already configured root is left alone.
+        return
+
+    formatter = logging.Formatter(LOG_FORMAT)
+    stream_handler = logging.StreamHandler()
+    stream_handler.setFormatter(formatter)
+    # delay=True defers opening app.log until the first record is written.
+    file_handler = RotatingFileHandler(
+        logfile,
+        maxBytes=LOG_MAX_BYTES,
+        backupCount=LOG_BACKUP_COUNT,
+        encoding="utf-8",
+        delay=True,
     )
+    file_handler.setFormatter(formatter)
+
+    # Callers only enqueue records; console and file I/O happen on the listener thread.
+    log_queue: queue.SimpleQueue[logging.LogRecord] = queue.SimpleQueue()
+    listener = QueueListener(log_queue, stream_handler, file_handler, respect_handler_level=True)
+    listener.start()
+    atexit.register(listener.stop)
+
+    root.setLevel(logging.INFO)
+    root.addHandler(QueueHandler(log_queue))
@@ -4,19 +4,33 @@ import keyring
 
 
 class SecretStore:
-    """Wrapper for OS keychain/keyring storage."""
+    """Wrapper for OS keychain/keyring storage.
+
+    Lookups are cached per instance; secrets changed outside this store need invalidate().
+    """
 
     def __init__(self, service_name: str = "task_automation_studio") -> None:
         self.service_name = service_name
+        self._cache: dict[str, str | None] = {}
 
     def set_secret(self, key: str, value: str) -> None:
         keyring.set_password(self.service_name, key, value)
+        self._cache[key] = value
 
     def get_secret(self, key: str) -> str | None:
-        return keyring.get_password(self.service_name, key)
+        if key not in self._cache:
+            self._cache[key] = keyring.get_password(self.service_name, key)
+        return self._cache[key]
 
     def delete_secret(self, key: str) -> None:
+        self._cache.pop(key, None)
         try:
             keyring.delete_password(self.service_name, key)
         except keyring.errors.PasswordDeleteError:
             return
+
+    def invalidate(self, key: str | None = None) -> None:
+        if key is None:
+            self._cache.clear()
+        else:
+            self._cache.pop(key, None)
@@ -1,21 +1,34 @@
 from __future__ import annotations
 
-import json
+import mmap
+import re
+from collections.abc import Mapping
+from functools import lru_cache
 from pathlib import Path
+from types import MappingProxyType
 from typing import Any
 
-from task_automation_studio.core.models import StepDefinition, StepPolicy, WorkflowDefinition
+import orjson
+from pydantic import TypeAdapter
 
+from task_automation_studio.core.models import StepDefinition, WorkflowDefinition
 
-STEP_TYPE_TO_ACTION = {
-    "open_url": "browser.open_url",
-    "fill_field": "browser.fill_field",
-    "click": "browser.click",
-    "wait_for": "browser.wait_for",
-    "fetch_otp": "email.fetch_otp",
-    "write_cell": "excel.write_cell",
-    "mark_record_done": "record.mark_record_done",
-}
+
+_FIRST_SIGNIFICANT_BYTE = re.compile(rb"[^ \t\r\n]")
+_MMAP_THRESHOLD_BYTES = 64 * 1024
+_STEP_LIST_ADAPTER = TypeAdapter(list[StepDefinition])
+
+STEP_TYPE_TO_ACTION: Mapping[str, str] = MappingProxyType(
+    {
+        "open_url": "browser.open_url",
+        "fill_field": "browser.fill_field",
+        "click": "browser.click",
+        "wait_for": "browser.wait_for",
+        "fetch_otp": "email.fetch_otp",
+        "write_cell": "excel.write_cell",
+        "mark_record_done": "record.mark_record_done",
+    }
+)
 
 
 def load_workflow_from_json(path: str | Path) -> WorkflowDefinition:
@@ -25,11 +38,12 @@ def load_workflow_from_json(path: str | Path) -> WorkflowDefinition:
     if not isinstance(steps_raw, list) or not steps_raw:
         raise ValueError("Workflow JSON must contain a non-empty 'steps' array.")
 
-    steps: list[StepDefinition] = []
+    normalized_steps: list[dict[str, Any]] = []
     for idx, item in enumerate(steps_raw, start=1):
         if not isinstance(item, dict):
             raise ValueError(f"Step #{idx} must be an object.")
-        steps.append(_build_step(item, idx))
+        normalized_steps.append(_normalize_step(item, idx))
+    steps = _STEP_LIST_ADAPTER.validate_python(normalized_steps)
 
     workflow_id = str(payload.get("workflow_id", "")).strip()
     name = str(payload.get("name", "")).strip()
@@ -50,42 +64,45 @@ def summarize_workflow(path: str | Path) -> dict[str, object]:
     }
 
 
-def _build_step(step_raw: dict[str, Any], index: int) -> StepDefinition:
-    step_id = str(step_raw.get("id", "")).strip()
+def _normalize_step(step_raw: dict[str, Any], index: int) -> dict[str, Any]:
+    get = step_raw.get
+    raw_id = get("id", "")
+    step_id = (raw_id if isinstance(raw_id, str) else str(raw_id)).strip()
     if not step_id:
         raise ValueError(f"Step #{index} is missing required field 'id'.")
 
     action = _resolve_action(step_raw)
-    params = step_raw.get("params", {})
+    params = get("params", {})
     if not isinstance(params, dict):
         raise ValueError(f"Step '{step_id}' has invalid 'params'. Expected object.")
 
-    required_inputs = step_raw.get("required_inputs", [])
+    required_inputs = get("required_inputs", [])
     if not isinstance(required_inputs, list):
         raise ValueError(f"Step '{step_id}' has invalid 'required_inputs'. Expected array.")
-    required_inputs = [str(v) for v in required_inputs]
+    required_inputs = [v if isinstance(v, str) else str(v) for v in required_inputs]
 
-    post_check = step_raw.get("post_check", {})
-    success_signals = [f"post_check:{key}" for key in post_check.keys()] if isinstance(post_check, dict) else []
+    post_check = get("post_check", {})
+    success_signals = [f"post_check:{key}" for key in post_check] if isinstance(post_check, dict) else []
 
-    retry = step_raw.get("retry", {})
+    retry = get("retry")
     if not isinstance(retry, dict):
         retry = {}
     max_attempts = int(retry.get("max_attempts", 3))
     backoff_seconds = int(retry.get("backoff_seconds", 2))
 
-    return StepDefinition(
-        step_id=step_id,
-        name=str(step_raw.get("name") or step_id).strip(),
-        action=action,
-        params=params,
-        required_inputs=required_inputs,
-        success_signals=success_signals,
-        policy=StepPolicy(
-            retry_count=max(0, max_attempts - 1),
-            retry_backoff_seconds=max(1, backoff_seconds),
-        ),
-    )
+    raw_name = get("name") or step_id
+    return {
+        "step_id": step_id,
+        "name": (raw_name if isinstance(raw_name, str) else str(raw_name)).strip(),
+        "action": action,
+        "params": params,
+        "required_inputs": required_inputs,
+        "success_signals": success_signals,
+        "policy": {
+            "retry_count": max(0, max_attempts - 1),
+            "retry_backoff_seconds": max(1, backoff_seconds),
+        },
+    }
 
 
 def _resolve_action(step_raw: dict[str, Any]) -> str:
@@ -105,10 +122,27 @@ def _resolve_action(step_raw: dict[str, Any]) -> str:
 
 def _read_json(path: str | Path) -> dict[str, Any]:
     workflow_path = Path(path)
-    if not workflow_path.exists():
-        raise FileNotFoundError(f"Workflow file not found: {workflow_path}")
-
-    data = json.loads(workflow_path.read_text(encoding="utf-8"))
-    if not isinstance(data, dict):
+    try:
+        stat = workflow_path.stat()
+    except FileNotFoundError:
+        raise FileNotFoundError(f"Workflow file not found: {workflow_path}") from None
+    return _read_json_cached(str(workflow_path.resolve()), stat.st_mtime_ns, stat.st_size)
+
+
+@lru_cache(maxsize=32)
+def _read_json_cached(resolved_path: str, mtime_ns: int, size: int) -> dict[str, Any]:
+    # Callers must treat the returned payload as read-only; it is shared between calls.
+    del mtime_ns
+    path = Path(resolved_path)
+    if size <= _MMAP_THRESHOLD_BYTES:
+        return _parse_json_object(path.read_bytes())
+    with path.open("rb") as handle, mmap.mmap(handle.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+        with memoryview(mapped) as view:
+            return _parse_json_object(view)
+
+
+def _parse_json_object(raw: bytes | memoryview) -> dict[str, Any]:
+    first_byte = _FIRST_SIGNIFICANT_BYTE.search(raw)
+    if first_byte is None or first_byte.group() != b"{":
         raise ValueError("Workflow file root must be a JSON object.")
-    return data
+    return orjson.loads(raw)
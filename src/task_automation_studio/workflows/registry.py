@@ -1,5 +1,7 @@
 from __future__ import annotations
 
+from collections.abc import Callable
+from functools import lru_cache
 from pathlib import Path
 
 from task_automation_studio.core.models import WorkflowDefinition
@@ -7,20 +9,39 @@ from task_automation_studio.workflows.loader import load_workflow_from_json
 from task_automation_studio.workflows.templates.zoom_signup import build_zoom_signup_workflow
 
 
+_WORKFLOW_BUILDERS: dict[str, Callable[[], WorkflowDefinition]] = {
+    "zoom_signup": build_zoom_signup_workflow,
+}
+_AVAILABLE_WORKFLOWS: tuple[str, ...] = tuple(_WORKFLOW_BUILDERS)
+_AVAILABLE_WORKFLOWS_TEXT = ", ".join(_AVAILABLE_WORKFLOWS)
+
+
 def list_available_workflows() -> list[str]:
-    return ["zoom_signup"]
+    return list(_AVAILABLE_WORKFLOWS)
 
 
 def load_workflow(workflow_name: str) -> WorkflowDefinition:
-    normalized = workflow_name.strip().lower()
-    if normalized == "zoom_signup":
-        return build_zoom_signup_workflow()
-    raise ValueError(f"Unsupported workflow '{workflow_name}'. Available: {', '.join(list_available_workflows())}")
+    builder = _WORKFLOW_BUILDERS.get(workflow_name.strip().lower())
+    if builder is not None:
+        return builder()
+    raise ValueError(f"Unsupported workflow '{workflow_name}'. Available: {_AVAILABLE_WORKFLOWS_TEXT}")
 
 
 def load_workflow_from_source(*, workflow_name: str | None = None, workflow_file: str | Path | None = None) -> WorkflowDefinition:
     if workflow_file:
-        return load_workflow_from_json(workflow_file)
+        workflow_path = Path(workflow_file)
+        try:
+            stat = workflow_path.stat()
+        except OSError:
+            return load_workflow_from_json(workflow_path)
+        return _load_workflow_file_cached(str(workflow_path.resolve()), stat.st_mtime_ns, stat.st_size)
     if workflow_name:
         return load_workflow(workflow_name)
     raise ValueError("Either workflow_name or workflow_file must be provided.")
+
+
+@lru_cache(maxsize=16)
+def _load_workflow_file_cached(resolved_path: str, mtime_ns: int, size: int) -> WorkflowDefinition:
+    # mtime_ns and size are part of the key so edited files are parsed again.
+    del mtime_ns, size
+    return load_workflow_from_json(resolved_path)
@@ -1,6 +1,13 @@
+from functools import lru_cache
+
+from task_automation_studio.connectors.email_connector import DEFAULT_OTP_PATTERN
 from task_automation_studio.core.models import StepDefinition, WorkflowDefinition
 
+__all__ = ["build_zoom_signup_workflow"]
+
 
+# The template is immutable (frozen models), so one shared instance serves every caller.
+@lru_cache(maxsize=1)
 def build_zoom_signup_workflow() -> WorkflowDefinition:
     return WorkflowDefinition(
         workflow_id="zoom_signup_v1",
@@ -38,7 +45,7 @@ def build_zoom_signup_workflow() -> WorkflowDefinition:
                 action="email.fetch_otp",
                 params={
                     "sender_contains": "zoom",
-                    "otp_pattern": r"\b(\d{6})\b",
+                    "otp_pattern": DEFAULT_OTP_PATTERN.pattern,
                     "lookback_minutes": 20,
                 },
                 required_inputs=["email"],
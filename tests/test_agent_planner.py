@@ -30,6 +30,18 @@ def test_skill_registry_filter_by_intent() -> None:
     assert matches[0].skill_id == "s1"
 
 
+def test_skill_registry_intent_index_tracks_registrations() -> None:
+    registry = AgentSkillRegistry()
+    registry.register(_skill(skill_id="s1", name="Locate A", intents=["Locate_Target"]))
+    assert [item.skill_id for item in registry.skills_for_intent(" locate_target ")] == ["s1"]
+
+    registry.register(_skill(skill_id="s2", name="Locate B", intents=["locate_target", "LOCATE_TARGET"]))
+    registry.register(_skill(skill_id="s1", name="Verify A", intents=["verify_outcome"]))
+    assert [item.skill_id for item in registry.skills_for_intent("locate_target")] == ["s2"]
+    assert [item.skill_id for item in registry.skills_for_intent("verify_outcome")] == ["s1"]
+    assert registry.skills_for_intent("unknown") == []
+
+
 def test_goal_planner_build_plan_with_requested_intents() -> None:
     registry = AgentSkillRegistry()
     registry.register(_skill(skill_id="locate", name="Locate UI", intents=["locate_target"], reliability=0.7))
@@ -1,5 +1,9 @@
 from __future__ import annotations
 
+import os
+import subprocess
+import sys
+
 import pytest
 
 from task_automation_studio.app import _parse_payload_json, _parse_payload_pairs, build_parser
@@ -29,6 +33,13 @@ def test_parse_payload_pairs() -> None:
     assert payload["value"] == "{{record.email}}"
 
 
+def test_parse_payload_pairs_rejects_malformed_pairs() -> None:
+    with pytest.raises(ValueError, match="Expected key=value"):
+        _parse_payload_pairs(["a=1", "missing-separator"])
+    with pytest.raises(ValueError, match="cannot be empty"):
+        _parse_payload_pairs([" =value"])
+
+
 def test_parser_supports_workflow_validate() -> None:
     parser = build_parser()
     args = parser.parse_args(["workflow", "validate", "--workflow-file", "x.json"])
@@ -58,3 +69,10 @@ def test_parser_supports_teach_replay_repeat_count() -> None:
     assert args.command == "teach"
     assert args.teach_command == "replay"
     assert args.repeat_count == 5
+
+
+def test_cli_import_does_not_load_qt() -> None:
+    code = "import sys, task_automation_studio.app; print('PySide6' in sys.modules, 'pandas' in sys.modules)"
+    env = {**os.environ, "PYTHONPATH": os.pathsep.join(sys.path)}
+    result = subprocess.run([sys.executable, "-c", code], capture_output=True, text=True, check=True, env=env)
+    assert result.stdout.strip() == "False False"
@@ -1,4 +1,5 @@
 import time
+from enum import Enum
 from pathlib import Path
 
 from task_automation_studio.core.teach_models import TeachEventType
@@ -19,10 +20,13 @@ class _FakeSessionService:
         self.events: list[dict[str, object]] = []
         self.finished: list[str] = []
 
-    def add_event(self, **kwargs):  # type: ignore[no-untyped-def]
+    def queue_event(self, **kwargs):  # type: ignore[no-untyped-def]
         self.events.append(kwargs)
         return None
 
+    def flush_events(self, *, session_id: str | None = None) -> None:
+        del session_id
+
     def finish_session(self, *, session_id: str) -> None:
         self.finished.append(session_id)
 
@@ -31,7 +35,7 @@ class _FakeSessionService:
 
 
 class _FailingSessionService(_FakeSessionService):
-    def add_event(self, **kwargs):  # type: ignore[no-untyped-def]
+    def queue_event(self, **kwargs):  # type: ignore[no-untyped-def]
         raise RuntimeError("db locked")
 
 
@@ -45,6 +49,15 @@ def test_key_to_name() -> None:
     assert _key_to_name(_FakeKey(char=None, fallback="Key.esc")) == "esc"
 
 
+def test_key_to_name_for_special_key_enum() -> None:
+    class Key(Enum):
+        shift_r = 1
+        esc = 2
+
+    assert _key_to_name(Key.shift_r) == "shift_r"
+    assert _key_to_name(Key.esc) == "esc"
+
+
 def test_hotkey_recording_ctrl_v() -> None:
     service = _FakeSessionService()
     recorder = AutoTeachRecorder(session_service=service)
@@ -90,7 +103,7 @@ def test_mouse_click_records_smart_locator_payload() -> None:
     assert event["event_id"]
 
 
-def test_mouse_click_callback_does_not_raise_when_add_event_fails() -> None:
+def test_mouse_click_callback_does_not_raise_when_queue_event_fails() -> None:
     service = _FailingSessionService()
     recorder = AutoTeachRecorder(session_service=service)
     recorder._session_id = "session-1"  # type: ignore[attr-defined]
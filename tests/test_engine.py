@@ -1,3 +1,6 @@
+import pytest
+
+from task_automation_studio.connectors.email_connector import DEFAULT_OTP_PATTERN
 from task_automation_studio.core.engine import WorkflowEngine
 from task_automation_studio.core.enums import ExecutionStatus, RecordStatus
 from task_automation_studio.core.models import (
@@ -7,6 +10,7 @@ from task_automation_studio.core.models import (
     StepExecutionResult,
     WorkflowDefinition,
 )
+from task_automation_studio.services import executors
 
 
 class DummyExecutor:
@@ -40,3 +44,33 @@ def test_engine_runs_happy_path() -> None:
 
     assert result.status == RecordStatus.SUCCESS
     assert len(result.step_results) == 1
+
+
+def test_email_otp_executor_reuses_compiled_default_pattern(monkeypatch: pytest.MonkeyPatch) -> None:
+    patterns: list[object] = []
+
+    class FakeConnector:
+        def __init__(self, **kwargs: object) -> None:
+            del kwargs
+
+        def fetch_latest_otp(self, *, sender_contains: str, otp_pattern: object, lookback_minutes: int) -> str:
+            del sender_contains, lookback_minutes
+            patterns.append(otp_pattern)
+            return "123456"
+
+    monkeypatch.setattr(executors, "EmailOTPConnector", FakeConnector)
+    executor = executors.EmailOtpStepExecutor(
+        executors.EmailRuntimeConfig(enabled=True, host="imap.example.com", username="u", password="p")
+    )
+    context = RecordContext(record=RecordInput(first_name="A", last_name="B", email="a@example.com"))
+    for params in ({}, {"otp_pattern": DEFAULT_OTP_PATTERN.pattern}, {"otp_pattern": r"(\d{4})"}):
+        step = StepDefinition(
+            step_id="otp",
+            name="otp",
+            action="email.fetch_otp",
+            params={"sender_contains": "zoom", **params},
+        )
+        result = executor.execute(step=step, context=context)
+        assert result.status == ExecutionStatus.SUCCESS
+
+    assert patterns == [DEFAULT_OTP_PATTERN, DEFAULT_OTP_PATTERN, r"(\d{4})"]
@@ -0,0 +1,61 @@
+from __future__ import annotations
+
+from pathlib import Path
+
+import pandas as pd
+import pytest
+
+from task_automation_studio.connectors import excel_connector
+from task_automation_studio.connectors.excel_connector import ExcelConnector
+
+
+def test_read_records_streams_xlsx_rows(tmp_path: Path) -> None:
+    path = tmp_path / "input.xlsx"
+    pd.DataFrame(
+        [
+            {"email": " A@Example.com ", "notes": "x", "last_name": 42, "first_name": "Ann"},
+            {"email": None, "notes": None, "last_name": None, "first_name": None},
+            {"email": "c@example.com", "notes": "", "last_name": "Doe", "first_name": " Cy "},
+        ]
+    ).to_excel(path, index=False)
+
+    records = ExcelConnector().read_records(path)
+
+    assert [(r.first_name, r.last_name, r.email) for r in records] == [
+        ("Ann", "42", "a@example.com"),
+        ("Cy", "Doe", "c@example.com"),
+    ]
+
+
+def test_read_records_reports_missing_columns(tmp_path: Path) -> None:
+    path = tmp_path / "input.xlsx"
+    pd.DataFrame([{"first_name": "A", "email": "a@example.com"}]).to_excel(path, index=False)
+
+    with pytest.raises(ValueError, match="last_name"):
+        ExcelConnector().read_records(path)
+
+
+@pytest.mark.parametrize("streamed", [True, False], ids=["openpyxl", "pandas"])
+def test_read_records_skips_blank_middle_rows(tmp_path: Path, monkeypatch: pytest.MonkeyPatch, streamed: bool) -> None:
+    if not streamed:
+        monkeypatch.setattr(excel_connector, "_STREAMABLE_SUFFIXES", frozenset())
+    path = tmp_path / "input.xlsx"
+    pd.DataFrame(
+        [
+            {"first_name": "Ann", "last_name": "Lee", "email": "a@example.com"},
+            {"first_name": None, "last_name": None, "email": None},
+            {"first_name": "Cy", "last_name": "Doe", "email": "c@example.com"},
+        ]
+    ).to_excel(path, index=False)
+
+    records = ExcelConnector().read_records(path)
+
+    assert [r.email for r in records] == ["a@example.com", "c@example.com"]
+
+
+def test_iter_records_validates_header_before_iteration(tmp_path: Path) -> None:
+    path = tmp_path / "input.xlsx"
+    pd.DataFrame([{"first_name": "A", "email": "a@example.com"}]).to_excel(path, index=False)
+
+    with pytest.raises(ValueError, match="last_name"):
+        ExcelConnector().iter_records(path)
@@ -1,6 +1,8 @@
 import pytest
+from pydantic import ValidationError
 
 from task_automation_studio.core.models import RecordInput
+from task_automation_studio.workflows.registry import load_workflow
 
 
 def test_record_input_valid_email_normalized() -> None:
@@ -11,3 +13,18 @@ def test_record_input_valid_email_normalized() -> None:
 def test_record_input_invalid_email_rejected() -> None:
     with pytest.raises(ValueError):
         RecordInput(first_name="A", last_name="B", email="bad-email")
+
+
+def test_record_input_strips_whitespace_and_is_frozen() -> None:
+    record = RecordInput(first_name=" A ", last_name="B\t", email=" User@Example.com ")
+    assert (record.first_name, record.last_name, record.email) == ("A", "B", "user@example.com")
+    with pytest.raises(ValidationError):
+        record.email = "other@example.com"
+
+
+def test_builtin_workflow_is_shared_and_immutable() -> None:
+    workflow = load_workflow("zoom_signup")
+
+    assert load_workflow("zoom_signup") is workflow
+    with pytest.raises(ValidationError):
+        workflow.steps[0].action = "browser.other"
@@ -1,8 +1,13 @@
 from __future__ import annotations
 
+import json
+import threading
 from pathlib import Path
 
 import pandas as pd
+import pytest
+from pydantic import ValidationError
+from sqlalchemy import select
 
 from task_automation_studio.config.settings import Settings
 from task_automation_studio.core.engine import WorkflowEngine
@@ -15,6 +20,8 @@ from task_automation_studio.core.models import (
     StepPolicy,
     WorkflowDefinition,
 )
+from task_automation_studio.persistence.database import init_database
+from task_automation_studio.persistence.models import JobRun
 from task_automation_studio.services.executors import EmailRuntimeConfig
 from task_automation_studio.services.runner import AutomationRunner
 from task_automation_studio.workflows.registry import load_workflow
@@ -128,3 +135,115 @@ def test_runner_safe_stop_on_high_error_rate(tmp_path: Path) -> None:
     assert summary.processed_records == 1
     assert summary.failed_count == 1
     assert summary.unprocessed_records == 2
+
+
+def test_runner_reports_progress_per_record(tmp_path: Path) -> None:
+    settings = _build_settings(tmp_path)
+    runner = AutomationRunner(settings=settings)
+    workflow = load_workflow("zoom_signup")
+    input_file = tmp_path / "employees.xlsx"
+    _write_input_excel(input_file)
+    progress: list[tuple[int, str]] = []
+
+    runner.run_excel_workflow(
+        workflow=workflow,
+        input_file=input_file,
+        output_file=None,
+        report_file=None,
+        dry_run=True,
+        safe_stop_error_rate=1.0,
+        email_config=EmailRuntimeConfig(enabled=False),
+        progress_callback=lambda processed, message: progress.append((processed, message)),
+    )
+
+    assert [item[0] for item in progress] == [1, 2, 3]
+    assert progress[1] == (2, "a@example.com: skipped")
+
+
+def test_runner_stops_between_records_when_stop_event_is_set(tmp_path: Path) -> None:
+    settings = _build_settings(tmp_path)
+    runner = AutomationRunner(settings=settings)
+    workflow = load_workflow("zoom_signup")
+    input_file = tmp_path / "employees.xlsx"
+    _write_input_excel(input_file)
+    stop_event = threading.Event()
+
+    summary = runner.run_excel_workflow(
+        workflow=workflow,
+        input_file=input_file,
+        output_file=None,
+        report_file=None,
+        dry_run=True,
+        safe_stop_error_rate=1.0,
+        email_config=EmailRuntimeConfig(enabled=False),
+        progress_callback=lambda processed, message: stop_event.set(),
+        stop_event=stop_event,
+    )
+
+    assert summary.cancelled is True
+    assert summary.processed_records == 1
+    assert summary.unprocessed_records == 2
+    assert summary.safe_stopped is False
+
+
+def test_runner_rejects_invalid_row_before_creating_a_job_run(tmp_path: Path) -> None:
+    settings = _build_settings(tmp_path)
+    runner = AutomationRunner(settings=settings)
+    workflow = load_workflow("zoom_signup")
+    input_file = tmp_path / "employees.xlsx"
+    pd.DataFrame(
+        [
+            {"first_name": "A", "last_name": "B", "email": "a@example.com"},
+            {"first_name": "C", "last_name": "D", "email": "bad-email"},
+            {"first_name": "E", "last_name": "F", "email": "e@example.com"},
+        ]
+    ).to_excel(input_file, index=False)
+    progress: list[tuple[int, str]] = []
+
+    with pytest.raises(ValidationError, match="Invalid email format"):
+        runner.run_excel_workflow(
+            workflow=workflow,
+            input_file=input_file,
+            output_file=None,
+            report_file=None,
+            dry_run=True,
+            safe_stop_error_rate=1.0,
+            email_config=EmailRuntimeConfig(enabled=False),
+            progress_callback=lambda processed, message: progress.append((processed, message)),
+        )
+
+    assert progress == []
+    with init_database(settings.database_url)() as session:
+        assert session.scalars(select(JobRun)).all() == []
+
+
+def test_runner_finalizes_job_run_when_a_record_raises(tmp_path: Path) -> None:
+    settings = _build_settings(tmp_path)
+    runner = AutomationRunner(settings=settings)
+    workflow = load_workflow("zoom_signup")
+    input_file = tmp_path / "employees.xlsx"
+    _write_input_excel(input_file)
+    report_file = tmp_path / "report.json"
+
+    def fail_on_second_record(processed: int, message: str) -> None:
+        del message
+        if processed == 2:
+            raise RuntimeError("boom")
+
+    with pytest.raises(RuntimeError, match="boom"):
+        runner.run_excel_workflow(
+            workflow=workflow,
+            input_file=input_file,
+            output_file=None,
+            report_file=report_file,
+            dry_run=True,
+            safe_stop_error_rate=1.0,
+            email_config=EmailRuntimeConfig(enabled=False),
+            progress_callback=fail_on_second_record,
+        )
+
+    with init_database(settings.database_url)() as session:
+        assert [job.status for job in session.scalars(select(JobRun))] == ["failed"]
+    report = json.loads(report_file.read_text(encoding="utf-8"))
+    assert report["processed_records"] == 2
+    assert report["unprocessed_records"] == 1
@@ -0,0 +1,28 @@
+from __future__ import annotations
+
+import pytest
+
+from task_automation_studio.utils import security
+from task_automation_studio.utils.security import SecretStore
+
+
+def test_secret_store_caches_lookups_until_invalidated(monkeypatch: pytest.MonkeyPatch) -> None:
+    backend = {("task_automation_studio", "imap"): "first"}
+    calls: list[str] = []
+
+    def _get_password(service_name: str, key: str) -> str | None:
+        calls.append(key)
+        return backend.get((service_name, key))
+
+    monkeypatch.setattr(security.keyring, "get_password", _get_password)
+    store = SecretStore()
+
+    assert store.get_secret("imap") == "first"
+    assert store.get_secret("imap") == "first"
+    assert store.get_secret("missing") is None
+    assert store.get_secret("missing") is None
+    assert calls == ["imap", "missing"]
+
+    backend[("task_automation_studio", "imap")] = "second"
+    store.invalidate("imap")
+    assert store.get_secret("imap") == "second"
@@ -49,3 +49,28 @@ def test_compile_teach_session_to_workflow(tmp_path: Path) -> None:
     workflow = load_workflow_from_json(output_file)
     assert workflow.workflow_id == "compiled_zoom_demo"
     assert workflow.steps[1].required_inputs == ["email"]
+
+
+def test_compile_reuses_output_until_session_changes(tmp_path: Path) -> None:
+    service = TeachSessionService(settings=_settings(tmp_path))
+    session = service.start_session(name="Cached compile")
+    service.add_event(
+        session_id=session.session_id,
+        event_type=TeachEventType.OPEN_URL,
+        payload={"url": "https://zoom.us/signup"},
+    )
+    compiler = TeachSessionCompiler(session_service=service)
+
+    first = compiler.compile_to_workflow(
+        session_id=session.session_id, workflow_id="wf", output_file=tmp_path / "first.json"
+    )
+    second = compiler.compile_to_workflow(
+        session_id=session.session_id, workflow_id="wf", output_file=tmp_path / "second.json"
+    )
+    assert first.read_bytes() == second.read_bytes()
+
+    service.add_event(session_id=session.session_id, event_type=TeachEventType.CHECKPOINT, payload={"name": "done"})
+    third = compiler.compile_to_workflow(
+        session_id=session.session_id, workflow_id="wf", output_file=tmp_path / "third.json"
+    )
+    assert len(json.loads(third.read_bytes())["steps"]) == 2
@@ -1,8 +1,13 @@
+import json
+import threading
+from contextlib import contextmanager
 from datetime import datetime, timezone
 from pathlib import Path
-import threading
+
+import pytest
 
 from task_automation_studio.core.teach_models import TeachEventData, TeachEventType
+from task_automation_studio.services import session_replay as sr
 from task_automation_studio.services.session_replay import (
     ReplaySummary,
     _button_name_to_key,
@@ -18,6 +23,21 @@ from task_automation_studio.services.session_replay import (
 )
 
 
+NOW = datetime(2024, 1, 1, tzinfo=timezone.utc)
+
+
+@pytest.fixture(scope="module")
+def replayer() -> TeachSessionReplayer:
+    return TeachSessionReplayer(session_service=None)  # type: ignore[arg-type]
+
+
+@pytest.fixture(scope="module")
+def stopped_event() -> threading.Event:
+    event = threading.Event()
+    event.set()
+    return event
+
+
 class _MouseStub:
     class Button:
         left = "LEFT"
@@ -40,10 +60,20 @@ class _KeyboardControllerStub:
         self.actions: list[tuple[str, str]] = []
 
     def press(self, key) -> None:  # type: ignore[no-untyped-def]
-        self.actions.append(("press", str(key)))
+        self.actions.append(("press", key if isinstance(key, str) else str(key)))
 
     def release(self, key) -> None:  # type: ignore[no-untyped-def]
-        self.actions.append(("release", str(key)))
+        self.actions.append(("release", key if isinstance(key, str) else str(key)))
+
+    @contextmanager
+    def pressed(self, *keys):  # type: ignore[no-untyped-def]
+        for key in keys:
+            self.press(key)
+        try:
+            yield
+        finally:
+            for key in reversed(keys):
+                self.release(key)
 
 
 class _MouseControllerStub:
@@ -57,10 +87,9 @@ class _MouseControllerStub:
         return None
 
 
-def test_normalize_speed_factor() -> None:
-    assert _normalize_speed_factor(1.5) == 1.5
-    assert _normalize_speed_factor(0) == 1.0
-    assert _normalize_speed_factor(99) == 10.0
+@pytest.mark.parametrize(("value", "expected"), [(1.5, 1.5), (0, 1.0), (99, 10.0)])
+def test_normalize_speed_factor(value: float, expected: float) -> None:
+    assert _normalize_speed_factor(value) == expected
 
 
 def test_normalize_repeat_count() -> None:
@@ -74,36 +103,39 @@ def test_event_time_ms_prefers_payload() -> None:
         event_id="e1",
         event_type=TeachEventType.KEY_PRESS,
         payload={"t_ms": 1234},
-        timestamp=datetime.now(timezone.utc),
+        timestamp=NOW,
     )
     assert _event_time_ms(event) == 1234
 
 
-def test_button_name_to_key() -> None:
-    assert _button_name_to_key("left", _MouseStub) == "LEFT"
-    assert _button_name_to_key("right", _MouseStub) == "RIGHT"
+@pytest.mark.parametrize(
+    ("name", "expected"),
+    [("left", "LEFT"), ("right", "RIGHT"), ("Middle", "MIDDLE"), ("unknown", "LEFT")],
+)
+def test_button_name_to_key(name: str, expected: str) -> None:
+    assert _button_name_to_key(name, _MouseStub) == expected
 
 
-def test_key_name_to_key() -> None:
-    assert _key_name_to_key("enter", _KeyStub) == "ENTER"
-    assert _key_name_to_key("a", _KeyStub) == "a"
+@pytest.mark.parametrize(("name", "expected"), [("enter", "ENTER"), ("ESC", "ESC"), ("a", "a"), ("B", "b")])
+def test_key_name_to_key(name: str, expected: str) -> None:
+    assert _key_name_to_key(name, _KeyStub) == expected
 
 
-def test_modifier_name_to_key() -> None:
-    assert _modifier_name_to_key("ctrl", _KeyStub) == "CTRL"
+@pytest.mark.parametrize(("name", "expected"), [("ctrl", "CTRL"), ("Shift", "SHIFT"), ("cmd", "CMD"), ("fn", None)])
+def test_modifier_name_to_key(name: str, expected: str | None) -> None:
+    assert _modifier_name_to_key(name, _KeyStub) == expected
 
 
-def test_apply_hotkey_event() -> None:
+def test_apply_hotkey_event(replayer: TeachSessionReplayer) -> None:
     event = TeachEventData(
         event_id="e_hotkey",
         event_type=TeachEventType.HOTKEY,
         payload={"key": "v", "modifiers": ["ctrl"]},
-        timestamp=datetime.now(timezone.utc),
+        timestamp=NOW,
     )
     keyboard_controller = _KeyboardControllerStub()
     mouse_controller = _MouseControllerStub()
 
-    replayer = TeachSessionReplayer(session_service=None)  # type: ignore[arg-type]
     result = replayer._apply_event(  # type: ignore[attr-defined]
         event=event,
         mouse_module=_MouseStub,
@@ -121,16 +153,15 @@ def test_apply_hotkey_event() -> None:
     ]
 
 
-def test_apply_key_press_event() -> None:
+def test_apply_key_press_event(replayer: TeachSessionReplayer) -> None:
     event = TeachEventData(
         event_id="e_key",
         event_type=TeachEventType.KEY_PRESS,
         payload={"key": "a"},
-        timestamp=datetime.now(timezone.utc),
+        timestamp=NOW,
     )
     keyboard_controller = _KeyboardControllerStub()
     mouse_controller = _MouseControllerStub()
-    replayer = TeachSessionReplayer(session_service=None)  # type: ignore[arg-type]
 
     result = replayer._apply_event(  # type: ignore[attr-defined]
         event=event,
@@ -143,16 +174,15 @@ def test_apply_key_press_event() -> None:
     assert keyboard_controller.actions == [("press", "a"), ("release", "a")]
 
 
-def test_apply_key_press_event_rejects_escape() -> None:
+def test_apply_key_press_event_rejects_escape(replayer: TeachSessionReplayer) -> None:
     event = TeachEventData(
         event_id="e_key_esc",
         event_type=TeachEventType.KEY_PRESS,
         payload={"key": "esc"},
-        timestamp=datetime.now(timezone.utc),
+        timestamp=NOW,
     )
     keyboard_controller = _KeyboardControllerStub()
     mouse_controller = _MouseControllerStub()
-    replayer = TeachSessionReplayer(session_service=None)  # type: ignore[arg-type]
 
     result = replayer._apply_event(  # type: ignore[attr-defined]
         event=event,
@@ -165,12 +195,14 @@ def test_apply_key_press_event_rejects_escape() -> None:
     assert keyboard_controller.actions == []
 
 
-def test_apply_mouse_click_prefers_smart_locator() -> None:
+def test_apply_mouse_click_prefers_smart_locator(
+    replayer: TeachSessionReplayer, monkeypatch: pytest.MonkeyPatch
+) -> None:
     event = TeachEventData(
         event_id="e_click",
         event_type=TeachEventType.MOUSE_CLICK,
         payload={"x": 10, "y": 20, "button": "left", "smart_locator": {"version": 1, "anchors": []}},
-        timestamp=datetime.now(timezone.utc),
+        timestamp=NOW,
     )
 
     class _MouseControllerCapture(_MouseControllerStub):
@@ -182,35 +214,30 @@ def test_apply_mouse_click_prefers_smart_locator() -> None:
             self.clicked = True
             return None
 
-    from task_automation_studio.services import session_replay as sr
-
-    original = sr.resolve_smart_click_position
-    sr.resolve_smart_click_position = lambda _payload: (44, 66)  # type: ignore[assignment]
-    try:
-        keyboard_controller = _KeyboardControllerStub()
-        mouse_controller = _MouseControllerCapture()
-        replayer = TeachSessionReplayer(session_service=None)  # type: ignore[arg-type]
-        result = replayer._apply_event(  # type: ignore[attr-defined]
-            event=event,
-            mouse_module=_MouseStub,
-            keyboard_module=_KeyStub,
-            mouse_controller=mouse_controller,
-            keyboard_controller=keyboard_controller,
-        )
-    finally:
-        sr.resolve_smart_click_position = original  # type: ignore[assignment]
+    monkeypatch.setattr(sr, "resolve_smart_click_position", lambda _payload: (44, 66))
+    keyboard_controller = _KeyboardControllerStub()
+    mouse_controller = _MouseControllerCapture()
+    result = replayer._apply_event(  # type: ignore[attr-defined]
+        event=event,
+        mouse_module=_MouseStub,
+        keyboard_module=_KeyStub,
+        mouse_controller=mouse_controller,
+        keyboard_controller=keyboard_controller,
+    )
 
     assert result.applied is True
     assert mouse_controller.position == (44, 66)
     assert mouse_controller.clicked is True
 
 
-def test_apply_mouse_click_preserves_right_button() -> None:
+def test_apply_mouse_click_preserves_right_button(
+    replayer: TeachSessionReplayer, monkeypatch: pytest.MonkeyPatch
+) -> None:
     event = TeachEventData(
         event_id="e_click_right",
         event_type=TeachEventType.MOUSE_CLICK,
         payload={"x": 10, "y": 20, "button": "right", "smart_locator": {"version": 1, "anchors": []}},
-        timestamp=datetime.now(timezone.utc),
+        timestamp=NOW,
     )
 
     class _MouseControllerCapture(_MouseControllerStub):
@@ -223,34 +250,27 @@ def test_apply_mouse_click_preserves_right_button() -> None:
             self.clicked_button = button
             return None
 
-    from task_automation_studio.services import session_replay as sr
-
-    original = sr.resolve_smart_click_position
-    sr.resolve_smart_click_position = lambda _payload: (44, 66)  # type: ignore[assignment]
-    try:
-        keyboard_controller = _KeyboardControllerStub()
-        mouse_controller = _MouseControllerCapture()
-        replayer = TeachSessionReplayer(session_service=None)  # type: ignore[arg-type]
-        result = replayer._apply_event(  # type: ignore[attr-defined]
-            event=event,
-            mouse_module=_MouseStub,
-            keyboard_module=_KeyStub,
-            mouse_controller=mouse_controller,
-            keyboard_controller=keyboard_controller,
-        )
-    finally:
-        sr.resolve_smart_click_position = original  # type: ignore[assignment]
+    monkeypatch.setattr(sr, "resolve_smart_click_position", lambda _payload: (44, 66))
+    keyboard_controller = _KeyboardControllerStub()
+    mouse_controller = _MouseControllerCapture()
+    result = replayer._apply_event(  # type: ignore[attr-defined]
+        event=event,
+        mouse_module=_MouseStub,
+        keyboard_module=_KeyStub,
+        mouse_controller=mouse_controller,
+        keyboard_controller=keyboard_controller,
+    )
 
     assert result.applied is True
     assert mouse_controller.clicked_button == "RIGHT"
 
 
-def test_apply_mouse_click_uses_click_count() -> None:
+def test_apply_mouse_click_uses_click_count(replayer: TeachSessionReplayer) -> None:
     event = TeachEventData(
         event_id="e_click_double",
         event_type=TeachEventType.MOUSE_CLICK,
         payload={"x": 10, "y": 20, "button": "left", "click_count": 2},
-        timestamp=datetime.now(timezone.utc),
+        timestamp=NOW,
     )
 
     class _MouseControllerCapture(_MouseControllerStub):
@@ -264,7 +284,6 @@ def test_apply_mouse_click_uses_click_count() -> None:
 
     keyboard_controller = _KeyboardControllerStub()
     mouse_controller = _MouseControllerCapture()
-    replayer = TeachSessionReplayer(session_service=None)  # type: ignore[arg-type]
     result = replayer._apply_event(  # type: ignore[attr-defined]
         event=event,
         mouse_module=_MouseStub,
@@ -277,12 +296,12 @@ def test_apply_mouse_click_uses_click_count() -> None:
     assert mouse_controller.clicked_count == 2
 
 
-def test_apply_mouse_click_fails_without_target() -> None:
+def test_apply_mouse_click_fails_without_target(replayer: TeachSessionReplayer) -> None:
     event = TeachEventData(
         event_id="e_click_missing",
         event_type=TeachEventType.MOUSE_CLICK,
         payload={"button": "left"},
-        timestamp=datetime.now(timezone.utc),
+        timestamp=NOW,
     )
 
     class _MouseControllerCapture(_MouseControllerStub):
@@ -296,7 +315,6 @@ def test_apply_mouse_click_fails_without_target() -> None:
 
     keyboard_controller = _KeyboardControllerStub()
     mouse_controller = _MouseControllerCapture()
-    replayer = TeachSessionReplayer(session_service=None)  # type: ignore[arg-type]
     result = replayer._apply_event(  # type: ignore[attr-defined]
         event=event,
         mouse_module=_MouseStub,
@@ -313,16 +331,15 @@ def test_resolve_click_target_fallback_to_coordinates() -> None:
     assert _resolve_click_target({"x": 12, "y": 99}) == (12, 99)
 
 
-def test_apply_hotkey_event_invalid_payload() -> None:
+def test_apply_hotkey_event_invalid_payload(replayer: TeachSessionReplayer) -> None:
     event = TeachEventData(
         event_id="e_hotkey_bad",
         event_type=TeachEventType.HOTKEY,
         payload={"key": "v", "modifiers": "ctrl"},
-        timestamp=datetime.now(timezone.utc),
+        timestamp=NOW,
     )
     keyboard_controller = _KeyboardControllerStub()
     mouse_controller = _MouseControllerStub()
-    replayer = TeachSessionReplayer(session_service=None)  # type: ignore[arg-type]
 
     result = replayer._apply_event(  # type: ignore[attr-defined]
         event=event,
@@ -350,10 +367,8 @@ def test_is_escape_key() -> None:
     assert _is_escape_key(_CharEsc()) is True
 
 
-def test_sleep_with_stop() -> None:
-    stop = threading.Event()
-    stop.set()
-    assert _sleep_with_stop(0.5, stop) is False
+def test_sleep_with_stop(stopped_event: threading.Event) -> None:
+    assert _sleep_with_stop(0.5, stopped_event) is False
 
 
 def test_replay_summary_to_dict_includes_diagnostics() -> None:
@@ -392,5 +407,5 @@ def test_save_diagnostics_writes_json(tmp_path: Path) -> None:
     )
     output = replayer.save_diagnostics(summary=summary)
     assert output.exists()
-    content = output.read_text(encoding="utf-8")
-    assert '"session_id": "s2"' in content
+    data = json.loads(output.read_bytes())
+    assert data["session_id"] == "s2"
@@ -1,3 +1,5 @@
+import pytest
+
 from task_automation_studio.services import smart_locator as sl
 from task_automation_studio.services.smart_locator import ClickProposal
 
@@ -40,7 +42,7 @@ def test_select_best_click_point_rejects_ambiguous() -> None:
     assert selected is None
 
 
-def test_resolve_smart_click_position_with_anchors() -> None:
+def test_resolve_smart_click_position_with_anchors(monkeypatch: pytest.MonkeyPatch) -> None:
     payload = {
         "x": 200,
         "y": 150,
@@ -53,13 +55,11 @@ def test_resolve_smart_click_position_with_anchors() -> None:
         },
     }
 
-    original = sl._locate_anchor_centers
-    sl._locate_anchor_centers = lambda path, region=None, confidence=0.9: [  # type: ignore[assignment]
-        (200, 150) if path == "target.png" else (200, 120)
-    ]
-    try:
-        resolved = sl.resolve_smart_click_position(payload)
-    finally:
-        sl._locate_anchor_centers = original  # type: ignore[assignment]
+    monkeypatch.setattr(
+        sl,
+        "_locate_anchor_centers",
+        lambda path, region=None, confidence=0.9: [(200, 150) if path == "target.png" else (200, 120)],
+    )
+    resolved = sl.resolve_smart_click_position(payload)
 
     assert resolved == (200, 150)
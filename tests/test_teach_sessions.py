@@ -3,8 +3,12 @@ from __future__ import annotations
 import json
 from pathlib import Path
 
+import pytest
+from sqlalchemy.exc import OperationalError
+
 from task_automation_studio.config.settings import Settings
 from task_automation_studio.core.teach_models import TeachEventType, TeachSessionStatus
+from task_automation_studio.persistence.teach_repository import TeachSessionRepository
 from task_automation_studio.services.teach_sessions import TeachSessionService
 
 
@@ -16,8 +20,15 @@ def _settings(tmp_path: Path) -> Settings:
     )
 
 
-def test_teach_session_lifecycle(tmp_path: Path) -> None:
-    service = TeachSessionService(settings=_settings(tmp_path))
+@pytest.fixture(scope="module")
+def teach_service(tmp_path_factory: pytest.TempPathFactory) -> TeachSessionService:
+    root = tmp_path_factory.mktemp("teach")
+    settings = Settings(database_url="sqlite:///:memory:", log_dir=root / "logs", artifacts_dir=root / "artifacts")
+    return TeachSessionService(settings=settings)
+
+
+def test_teach_session_lifecycle(teach_service: TeachSessionService) -> None:
+    service = teach_service
 
     session = service.start_session(name="Zoom onboarding")
     assert session.status == TeachSessionStatus.RECORDING
@@ -35,8 +46,8 @@ def test_teach_session_lifecycle(tmp_path: Path) -> None:
     assert finished.status == TeachSessionStatus.FINISHED
 
 
-def test_teach_session_export(tmp_path: Path) -> None:
-    service = TeachSessionService(settings=_settings(tmp_path))
+def test_teach_session_export(teach_service: TeachSessionService, tmp_path: Path) -> None:
+    service = teach_service
     session = service.start_session(name="Export me")
     service.add_event(
         session_id=session.session_id,
@@ -51,3 +62,80 @@ def test_teach_session_export(tmp_path: Path) -> None:
     payload = json.loads(output.read_text(encoding="utf-8"))
     assert payload["session_id"] == session.session_id
     assert payload["events"][0]["event_type"] == TeachEventType.CHECKPOINT
+
+
+def test_record_event_returns_only_the_new_event(teach_service: TeachSessionService) -> None:
+    service = teach_service
+    session = service.start_session(name="Incremental")
+
+    event = service.record_event(
+        session_id=session.session_id,
+        event_type=TeachEventType.CLICK,
+        payload={"selector": "#submit"},
+    )
+
+    stored = service.get_session(session_id=session.session_id)
+    assert [item.event_id for item in stored.events] == [event.event_id]
+    assert event.payload == {"selector": "#submit"}
+
+
+def test_queued_events_are_written_in_batches(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setattr("task_automation_studio.services.teach_sessions.EVENT_FLUSH_THRESHOLD", 3)
+    service = TeachSessionService(settings=_settings(tmp_path))
+    reader = TeachSessionService(settings=_settings(tmp_path))
+    session = service.start_session(name="Batched")
+
+    for index in range(4):
+        service.queue_event(session_id=session.session_id, event_type=TeachEventType.KEY_PRESS, payload={"i": index})
+    assert [event.payload["i"] for event in reader.get_session(session_id=session.session_id).events] == [0, 1, 2]
+
+    finished = service.finish_session(session_id=session.session_id)
+    assert [event.payload["i"] for event in finished.events] == [0, 1, 2, 3]
+
+
+def test_failed_flush_keeps_events_queued(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    service = TeachSessionService(settings=_settings(tmp_path))
+    first = service.start_session(name="First")
+    second = service.start_session(name="Second")
+    for session in (first, second):
+        service.queue_event(session_id=session.session_id, event_type=TeachEventType.KEY_PRESS, payload={"i": 0})
+
+    def fail_add_events(self: object, *, session_id: str, events: object) -> None:
+        raise OperationalError("INSERT INTO teach_events", {}, Exception("database is locked"))
+
+    with monkeypatch.context() as patch:
+        patch.setattr(TeachSessionRepository, "add_events", fail_add_events)
+        with pytest.raises(OperationalError, match="database is locked"):
+            service.flush_events()
+
+    service.queue_event(session_id=first.session_id, event_type=TeachEventType.KEY_PRESS, payload={"i": 1})
+    assert [event.payload["i"] for event in service.get_session(session_id=first.session_id).events] == [0, 1]
+    assert [event.payload["i"] for event in service.get_session(session_id=second.session_id).events] == [0]
+
+
+def test_queue_event_rejects_finished_session(teach_service: TeachSessionService) -> None:
+    session = teach_service.start_session(name="Finished")
+    teach_service.finish_session(session_id=session.session_id)
+
+    with pytest.raises(ValueError, match="not in recording state"):
+        teach_service.queue_event(session_id=session.session_id, event_type=TeachEventType.KEY_PRESS)
+    with pytest.raises(ValueError, match="not found"):
+        teach_service.queue_event(session_id="missing", event_type=TeachEventType.KEY_PRESS)
+
+
+def test_flush_drops_batches_for_sessions_finished_elsewhere(tmp_path: Path) -> None:
+    service = TeachSessionService(settings=_settings(tmp_path))
+    other = TeachSessionService(settings=_settings(tmp_path))
+    finished = service.start_session(name="Finished elsewhere")
+    active = service.start_session(name="Active")
+    for session in (finished, active):
+        service.queue_event(session_id=session.session_id, event_type=TeachEventType.KEY_PRESS, payload={"i": 0})
+    other.finish_session(session_id=finished.session_id)
+
+    service.flush_events()
+
+    sessions = {item.session_id: item for item in service.list_sessions()}
+    assert sessions[finished.session_id].events == []
+    assert [event.payload["i"] for event in sessions[active.session_id].events] == [0]
+    with pytest.raises(ValueError, match="not in recording state"):
+        service.queue_event(session_id=finished.session_id, event_type=TeachEventType.KEY_PRESS)
@@ -6,6 +6,7 @@ from pathlib import Path
 import pytest
 
 from task_automation_studio.workflows.loader import load_workflow_from_json, summarize_workflow
+from task_automation_studio.workflows.registry import load_workflow_from_source
 
 
 def test_load_workflow_from_json_maps_step_types(tmp_path: Path) -> None:
@@ -57,3 +58,46 @@ def test_summarize_workflow(tmp_path: Path) -> None:
     summary = summarize_workflow(workflow_file)
     assert summary["workflow_id"] == "wf_summary"
     assert summary["steps_count"] == 1
+
+
+def test_load_workflow_from_source_reuses_parsed_file_until_it_changes(tmp_path: Path) -> None:
+    workflow_file = tmp_path / "workflow.json"
+    payload = {
+        "workflow_id": "wf_cached",
+        "name": "Cached",
+        "steps": [{"id": "s1", "type": "open_url", "params": {"url": "https://example.com"}}],
+    }
+    workflow_file.write_text(json.dumps(payload), encoding="utf-8")
+
+    first = load_workflow_from_source(workflow_file=workflow_file)
+    assert load_workflow_from_source(workflow_file=str(workflow_file)) is first
+
+    payload["name"] = "Cached and edited"
+    workflow_file.write_text(json.dumps(payload), encoding="utf-8")
+    edited = load_workflow_from_source(workflow_file=workflow_file)
+    assert edited is not first
+    assert edited.name == "Cached and edited"
+
+
+def test_load_workflow_from_json_rejects_non_object_root(tmp_path: Path) -> None:
+    workflow_file = tmp_path / "list_root.json"
+    workflow_file.write_text('  [{"id": "s1"}]', encoding="utf-8")
+
+    with pytest.raises(ValueError, match="root must be a JSON object"):
+        load_workflow_from_json(workflow_file)
+
+
+def test_load_workflow_from_json_reads_large_files(tmp_path: Path) -> None:
+    workflow_file = tmp_path / "large_workflow.json"
+    payload = {
+        "workflow_id": "wf_large",
+        "name": "Large",
+        "steps": [{"id": f"s{idx}", "type": "click", "params": {"selector": "#go"}} for idx in range(2000)],
+    }
+    workflow_file.write_text(json.dumps(payload), encoding="utf-8")
+    assert workflow_file.stat().st_size > 64 * 1024
+
+    workflow = load_workflow_from_json(workflow_file)
+
+    assert len(workflow.steps) == 2000
+    assert workflow.steps[-1].action == "browser.click"